@@ -0,0 +1,134 @@
+"""
+Benchmark the pipelines.
+
+    python -m benchmarks --docs 2000 --output results.json
+    python -m benchmarks.compare old.json new.json
+"""
+
+import argparse
+import json
+import textwrap
+from pathlib import Path
+
+from benchmarks import corpus, runners
+
+
+def main(args: argparse.Namespace) -> None:
+    texts = corpus.make_corpus(args.docs, seed=args.seed)
+
+    results = []
+    for name in args.pipelines:
+        pipeline_results = runners.run_pipeline(
+            name,
+            texts,
+            args.modes,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            batch_size=args.batch_size,
+            n_process=args.n_process,
+        )
+        for result in pipeline_results:
+            print(
+                f"{name:<10} {result['mode']:<12} "
+                f"{result['docs_per_sec']:>10,.1f} docs/s "
+                f"{result['ms_per_doc']:>8.3f} ms/doc "
+                f"{result['max_rss_mb']:>8.1f} MB"
+            )
+        results += pipeline_results
+
+    report = {
+        "metadata": runners.metadata(),
+        "corpus": {"docs": args.docs, "seed": args.seed},
+        "results": results,
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with args.output.open("w") as out:
+            json.dump(report, out, indent=2)
+
+
+def parse_args() -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=textwrap.dedent(
+            """Measure the throughput and per-pipe latency of the pipelines."""
+        ),
+    )
+
+    arg_parser.add_argument(
+        "--pipelines",
+        choices=list(runners.PIPELINES),
+        nargs="+",
+        default=list(runners.PIPELINES),
+        help="""Benchmark these pipelines. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--modes",
+        choices=runners.MODES,
+        nargs="+",
+        default=list(runners.MODES),
+        help="""Run the pipelines in these modes. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--docs",
+        type=int,
+        default=1000,
+        metavar="INT",
+        help="""How many labels to put into the corpus. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--seed",
+        type=int,
+        default=1,
+        metavar="INT",
+        help="""Seed for the corpus generator. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--warmup",
+        type=int,
+        default=50,
+        metavar="INT",
+        help="""Parse this many docs before timing. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        metavar="INT",
+        help="""Time each mode this many times. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=128,
+        metavar="INT",
+        help="""Batch size for the pipe modes. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--n-process",
+        type=int,
+        default=2,
+        metavar="INT",
+        help="""Processes for the multiprocess mode. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="PATH",
+        help="""Write the results to this JSON file.""",
+    )
+
+    return arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,73 @@
+"""
+Compare two benchmark result files.
+
+    python -m benchmarks.compare old.json new.json
+"""
+
+import argparse
+import json
+import textwrap
+from pathlib import Path
+from typing import Any
+
+
+def main(args: argparse.Namespace) -> None:
+    old = best_runs(load(args.old))
+    new = best_runs(load(args.new))
+
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key]["ms_per_doc"], new[key]["ms_per_doc"]
+        change = (after - before) / before * 100.0
+        flag = "  <-- slower" if change > args.threshold else ""
+        print(
+            f"{key[0]:<10} {key[1]:<12} {before:>8.3f} -> {after:>8.3f} ms/doc "
+            f"{change:>+7.1f}%{flag}"
+        )
+
+
+def load(path: Path) -> list[dict[str, Any]]:
+    with path.open() as in_file:
+        return json.load(in_file)["results"]
+
+
+def best_runs(results: list[dict[str, Any]]) -> dict[tuple[str, str], dict]:
+    """Keep the fastest of repeated runs for each pipeline and mode."""
+    best = {}
+    for result in results:
+        key = (result["pipeline"], result["mode"])
+        if key not in best or result["ms_per_doc"] < best[key]["ms_per_doc"]:
+            best[key] = result
+    return best
+
+
+def parse_args() -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=textwrap.dedent("""Compare two benchmark result files."""),
+    )
+
+    arg_parser.add_argument(
+        "old",
+        type=Path,
+        help="""The baseline results.""",
+    )
+
+    arg_parser.add_argument(
+        "new",
+        type=Path,
+        help="""The results to compare against the baseline.""",
+    )
+
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=5.0,
+        metavar="PERCENT",
+        help="""Flag anything slower by this much. (default: %(default)s)""",
+    )
+
+    return arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
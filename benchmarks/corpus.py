@@ -0,0 +1,167 @@
+"""
+Make a synthetic corpus of herbarium labels.
+
+The labels are built from the same term lists the rules use, mixed with the kinds of
+strings found in the tests, so every trait gets exercised. The same seed always gives
+the same corpus, so runs can be compared across releases.
+
+There are also long pages of OCR text, made by running labels together and adding
+the stray punctuation and broken words that OCR leaves behind.
+"""
+
+import random
+import uuid
+from pathlib import Path
+
+from traiter.pylib import term_util
+
+TERMS = Path(__file__).parent.parent / "traiter" / "rules" / "terms"
+
+MONTHS = ["Jan", "Feb.", "March", "Apr", "May", "June", "Jul.", "Aug", "Sept", "Oct"]
+ROMAN = ["I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X", "XI", "XII"]
+
+FILLER = [
+    "Plants perennial, usually glabrous, sometimes sparsely hairy.",
+    "Stems 30-70 cm. Leaves: stipules lanceolate to oblong.",
+    "Common in disturbed areas along the roadside.",
+    "Growing with Quercus agrifolia and Salvia mellifera.",
+    "Herbarium of the University of Arizona.",
+    "Det. by J. Smith, 1998.",
+    "Shrub to 2 m tall, flowers fragrant.",
+    "Abundant locally, few plants seen.",
+]
+
+OCR_NOISE = [*"|~^»«•—–_*°`'\"/\\()[]", ",.", ".,", ";:", "..", "''", "-—"]
+
+# How often each kind of OCR damage happens to a word
+OCR_DAMAGE = {
+    "none": 0.82,
+    "stray": 0.10,
+    "broken": 0.03,
+    "joined": 0.03,
+    "specks": 0.02,
+}
+
+
+def make_corpus(size: int, seed: int = 1) -> list[str]:
+    """Make a list of labels."""
+    rng = random.Random(seed)  # noqa: S311
+    habitats = term_patterns("habitat_terms.csv", "habitat_term")
+    colors = term_patterns("color_terms.csv", "color_term")
+
+    parts = [
+        lat_long,
+        date,
+        elevation,
+        trs,
+        utm,
+        lambda r: color(r, colors),
+        lambda r: habitat(r, habitats),
+        label_uuid,
+        lambda r: r.choice(FILLER),
+    ]
+
+    corpus = []
+    for _ in range(size):
+        chosen = rng.sample(parts, k=rng.randint(3, len(parts)))
+        corpus.append(" ".join(p(rng) for p in chosen))
+    return corpus
+
+
+def make_ocr_pages(size: int, seed: int = 1, labels_per_page: int = 40) -> list[str]:
+    """Make a list of long, noisy OCR pages."""
+    rng = random.Random(seed)  # noqa: S311
+    labels = make_corpus(size * labels_per_page, seed=seed)
+
+    pages = []
+    for i in range(size):
+        words = " ".join(labels[i * labels_per_page : (i + 1) * labels_per_page])
+        page = []
+        for word in words.split():
+            damage = rng.choices(list(OCR_DAMAGE), weights=OCR_DAMAGE.values())[0]
+            match damage:
+                case "stray":  # Punctuation stuck to a word
+                    noise = rng.choice(OCR_NOISE)
+                    page.append(rng.choice([f"{noise}{word} ", f"{word}{noise} "]))
+                case "broken":  # A word broken across lines
+                    cut = rng.randint(1, max(1, len(word) - 1))
+                    page.append(f"{word[:cut]}-\n{word[cut:]} ")
+                case "joined":  # A lost space
+                    page.append(f"{word}{rng.choice(OCR_NOISE)}")
+                case "specks":  # Specks read as punctuation
+                    specks = "".join(rng.choices(OCR_NOISE, k=rng.randint(1, 4)))
+                    page.append(f"{specks}{word} ")
+                case _:
+                    page.append(f"{word} ")
+        pages.append("".join(page))
+    return pages
+
+
+def term_patterns(csv_name: str, label: str) -> list[str]:
+    terms = term_util.read_terms(TERMS / csv_name)
+    return sorted({t["pattern"] for t in terms if t["label"] == label})
+
+
+def lat_long(rng: random.Random) -> str:
+    lat, long = rng.uniform(20.0, 49.0), rng.uniform(70.0, 124.0)
+    match rng.randint(0, 2):
+        case 0:
+            return f"{lat:.5f}N, {long:.5f}W"
+        case 1:
+            return f"Lat {lat:.1f} N {long:.1f} W"
+        case _:
+            return (
+                f"{int(lat)}° {rng.randint(0, 59)}' {rng.randint(0, 59)}\" N, "
+                f"{int(long)}° {rng.randint(0, 59)}' {rng.randint(0, 59)}\" W"
+            )
+
+
+def date(rng: random.Random) -> str:
+    day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(1890, 2020)
+    match rng.randint(0, 3):
+        case 0:
+            return f"Collected {day} {rng.choice(MONTHS)} {year}"
+        case 1:
+            return f"Date: {month}/{day}/{year % 100:02d}"
+        case 2:
+            return f"{day}-{ROMAN[month - 1]}-{year}"
+        case _:
+            return f"{rng.choice(MONTHS)} {year}"
+
+
+def elevation(rng: random.Random) -> str:
+    match rng.randint(0, 2):
+        case 0:
+            return f"Elevation: {rng.randint(10, 4000)}m"
+        case 1:
+            return f"elev. {rng.randint(100, 9000)} ft."
+        case _:
+            low = rng.randint(100, 4000)
+            return f"Alt. {low}-{low + rng.randint(10, 500)} m"
+
+
+def trs(rng: random.Random) -> str:
+    return (
+        f"T{rng.randint(1, 40)}{rng.choice('NS')} "
+        f"R{rng.randint(1, 40)}{rng.choice('EW')} "
+        f"Sec {rng.randint(1, 36)}"
+    )
+
+
+def utm(rng: random.Random) -> str:
+    return (
+        f"UTM: {rng.randint(10, 14)}{rng.choice('RST')} "
+        f"{rng.randint(100000, 999999)}E {rng.randint(3000000, 4999999)}N"
+    )
+
+
+def color(rng: random.Random, colors: list[str]) -> str:
+    return f"petals {rng.choice(colors)} or {rng.choice(colors)}."
+
+
+def habitat(rng: random.Random, habitats: list[str]) -> str:
+    return f"{rng.choice(habitats).capitalize()} near the creek."
+
+
+def label_uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
@@ -0,0 +1,192 @@
+"""
+Time a pipeline over a corpus in different modes.
+
+Each pipeline is benchmarked in a fresh process, so the peak memory use reported for
+it does not include any pipeline that ran before it. The memory used by the workers
+in the multiprocess mode is reported separately.
+"""
+
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+import spacy
+from spacy.language import Language
+
+from traiter.pylib import batch, pipeline
+
+MODES = ("single", "pipe", "multiprocess")
+
+PIPELINES = {"build": pipeline.build, "numerical": pipeline.numerical}
+
+
+def run_pipeline(
+    name: str,
+    texts: list[str],
+    modes: list[str],
+    *,
+    repeat: int = 1,
+    warmup: int = 50,
+    batch_size: int = 128,
+    n_process: int = 2,
+) -> list[dict[str, Any]]:
+    """Benchmark a pipeline in all of the modes in a new process."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context) as executor:
+        future = executor.submit(
+            benchmark,
+            name,
+            texts,
+            modes,
+            repeat=repeat,
+            warmup=warmup,
+            batch_size=batch_size,
+            n_process=n_process,
+        )
+        return future.result()
+
+
+def benchmark(
+    name: str,
+    texts: list[str],
+    modes: list[str],
+    *,
+    repeat: int,
+    warmup: int,
+    batch_size: int,
+    n_process: int,
+) -> list[dict[str, Any]]:
+    start = time.perf_counter()
+    nlp = PIPELINES[name]()
+    load_secs = round(time.perf_counter() - start, 4)
+
+    # Warm up caches and lazily loaded data
+    for text in texts[:warmup]:
+        nlp(text)
+
+    results = []
+    for mode in modes:
+        for _ in range(repeat):
+            result = run(
+                name, nlp, texts, mode, batch_size=batch_size, n_process=n_process
+            )
+            result["load_secs"] = load_secs
+            results.append(result)
+    return results
+
+
+def run(
+    name: str,
+    nlp: Language,
+    texts: list[str],
+    mode: str,
+    *,
+    batch_size: int = 128,
+    n_process: int = 2,
+) -> dict[str, Any]:
+    """Run the named pipeline over the texts once and report how long it took."""
+    pipes = None
+    start = time.perf_counter()
+
+    match mode:
+        case "single":
+            pipes = single(nlp, texts)
+        case "pipe":
+            for _ in nlp.pipe(texts, batch_size=batch_size):
+                pass
+        case "multiprocess":
+            multiprocess(name, texts, batch_size, n_process)
+        case _:
+            msg = f"Unknown benchmark mode: {mode}"
+            raise ValueError(msg)
+
+    seconds = time.perf_counter() - start
+
+    result = {
+        "pipeline": name,
+        "mode": mode,
+        "docs": len(texts),
+        "chars": sum(len(t) for t in texts),
+        "seconds": round(seconds, 4),
+        "docs_per_sec": round(len(texts) / seconds, 1),
+        "ms_per_doc": round(seconds * 1000.0 / len(texts), 4),
+        "max_rss_mb": max_rss_mb(),
+    }
+    if mode == "pipe":
+        result["batch_size"] = batch_size
+    if mode == "multiprocess":
+        result |= {
+            "batch_size": batch_size,
+            "n_process": n_process,
+            "worker_max_rss_mb": max_rss_mb(resource.RUSAGE_CHILDREN),
+        }
+    if pipes:
+        result["pipes_ms_per_doc"] = pipes
+
+    return result
+
+
+def single(nlp: Language, texts: list[str]) -> dict[str, float]:
+    """Run one doc at a time and time each pipe."""
+    elapsed = defaultdict(float)
+
+    for text in texts:
+        start = time.perf_counter()
+        doc = nlp.make_doc(text)
+        elapsed["tokenizer"] += time.perf_counter() - start
+
+        for name, pipe in nlp.pipeline:
+            start = time.perf_counter()
+            doc = pipe(doc)
+            elapsed[name] += time.perf_counter() - start
+
+    return {k: round(v * 1000.0 / len(texts), 4) for k, v in elapsed.items()}
+
+
+def multiprocess(name: str, texts: list[str], batch_size: int, n_process: int) -> None:
+    """
+    Extract the traits with worker processes that each build their own pipeline.
+
+    The time includes starting the workers, as it does for any real run.
+    """
+    records = list(enumerate(texts))
+    for _ in batch.extract(
+        records,
+        builder=PIPELINES[name],
+        clean=None,
+        batch_size=batch_size,
+        n_process=n_process,
+    ):
+        pass
+
+
+def max_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    """Get the peak memory used by this process, or by its largest finished child."""
+    rss = resource.getrusage(who).ru_maxrss
+    rss /= 1024 * 1024 if sys.platform == "darwin" else 1024  # Bytes vs kilobytes
+    return round(rss, 1)
+
+
+def metadata() -> dict[str, Any]:
+    """Describe the environment so results from different releases can be compared."""
+    return {
+        "traiter": traiter_version(),
+        "spacy": spacy.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def traiter_version() -> str:
+    try:
+        return version("traiter")
+    except PackageNotFoundError:
+        return "unknown"
@@ -0,0 +1,139 @@
+"""
+Benchmark the tokenizer on long OCR pages with lots of punctuation.
+
+    python -m benchmarks.tokenizer --pages 200 --output tokenizer.json
+    python -m benchmarks.compare old.json new.json
+
+Our tokenizer is compared with spaCy's default English tokenizer. The time it takes
+to set up our tokenizer is also reported, both for the first pipeline in a process
+and for later ones that reuse the compiled regexes.
+"""
+
+import argparse
+import json
+import textwrap
+import time
+from pathlib import Path
+from typing import Any
+
+import spacy
+from spacy.tokenizer import Tokenizer
+
+from benchmarks import corpus, runners
+from traiter.pipes import tokenizer
+
+
+def main(args: argparse.Namespace) -> None:
+    pages = corpus.make_ocr_pages(args.pages, seed=args.seed)
+
+    setup = setup_secs()
+    print(f"setup      first {setup['first']:.4f} s, later {setup['later']:.4f} s")
+
+    results = []
+    for name, tokenize in tokenizers().items():
+        for _ in range(args.repeat):
+            result = run(name, tokenize, pages)
+            results.append(result)
+            print(
+                f"{name:<10} {result['chars_per_sec']:>12,.0f} chars/s "
+                f"{result['tokens_per_sec']:>10,.0f} tokens/s "
+                f"{result['ms_per_doc']:>8.3f} ms/page"
+            )
+
+    report = {
+        "metadata": runners.metadata(),
+        "corpus": {"pages": args.pages, "seed": args.seed},
+        "setup_secs": setup,
+        "results": results,
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with args.output.open("w") as out:
+            json.dump(report, out, indent=2)
+
+
+def setup_secs() -> dict[str, float]:
+    """Time setting up the tokenizer for the first and then a later pipeline."""
+    times = {}
+    for key in ("first", "later"):
+        nlp = spacy.blank("en")
+        start = time.perf_counter()
+        tokenizer.setup_tokenizer(nlp)
+        times[key] = round(time.perf_counter() - start, 4)
+    return times
+
+
+def tokenizers() -> dict[str, Tokenizer]:
+    default = spacy.blank("en")
+    traiter = spacy.blank("en")
+    tokenizer.setup_tokenizer(traiter)
+    return {"default": default.tokenizer, "traiter": traiter.tokenizer}
+
+
+def run(name: str, tokenize: Tokenizer, pages: list[str]) -> dict[str, Any]:
+    tokens = 0
+    start = time.perf_counter()
+    for page in pages:
+        tokens += len(tokenize(page))
+    seconds = time.perf_counter() - start
+
+    chars = sum(len(p) for p in pages)
+    return {
+        "pipeline": "tokenizer",
+        "mode": name,
+        "docs": len(pages),
+        "chars": chars,
+        "tokens": tokens,
+        "seconds": round(seconds, 4),
+        "chars_per_sec": round(chars / seconds, 1),
+        "tokens_per_sec": round(tokens / seconds, 1),
+        "docs_per_sec": round(len(pages) / seconds, 1),
+        "ms_per_doc": round(seconds * 1000.0 / len(pages), 4),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=textwrap.dedent(
+            """Measure the tokenizer's throughput on long, noisy OCR pages."""
+        ),
+    )
+
+    arg_parser.add_argument(
+        "--pages",
+        type=int,
+        default=200,
+        metavar="INT",
+        help="""How many OCR pages to tokenize. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--seed",
+        type=int,
+        default=1,
+        metavar="INT",
+        help="""Seed for the corpus generator. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        metavar="INT",
+        help="""Time each tokenizer this many times. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="PATH",
+        help="""Write the results to this JSON file.""",
+    )
+
+    return arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
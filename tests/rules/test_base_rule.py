@@ -0,0 +1,67 @@
+import unittest
+from dataclasses import dataclass
+
+from traiter.rules.base_rule import BaseRule
+
+
+@dataclass(eq=False, slots=True)
+class Part(BaseRule):
+    part: str | None = None
+
+
+@dataclass(eq=False, slots=True)
+class Leaf(BaseRule):
+    length: float | None = None
+    notes: list[str] | None = None
+    part: Part | None = None
+    parts: list[Part] | None = None
+
+
+@dataclass(eq=False, slots=True)
+class Stem(BaseRule):
+    length: float | None = None
+
+
+class TestBaseRule(unittest.TestCase):
+    def test_base_rule_01(self) -> None:
+        """It outputs the public fields that have a value."""
+        leaf = Leaf(_trait="leaf", _text="3 cm", start=0, end=4, length=3.0)
+        self.assertEqual(leaf.to_dict(), {"start": 0, "end": 4, "length": 3.0})
+
+    def test_base_rule_02(self) -> None:
+        """It converts nested traits to dicts and copies lists."""
+        notes = ["hairy"]
+        leaf = Leaf(
+            start=0,
+            end=4,
+            notes=notes,
+            part=Part(_trait="part", start=0, end=2, part="blade"),
+            parts=[Part(start=2, end=4, part="tip")],
+        )
+        part = {"_trait": "part", "_text": "", "start": 0, "end": 2, "part": "blade"}
+        tip = {"_trait": "", "_text": "", "start": 2, "end": 4, "part": "tip"}
+
+        dict_ = leaf.to_dict()
+        self.assertEqual(
+            dict_,
+            {"start": 0, "end": 4, "notes": ["hairy"], "part": part, "parts": [tip]},
+        )
+        self.assertIsNot(dict_["notes"], notes)
+
+    def test_base_rule_03(self) -> None:
+        """Traits of the same class are equal when their public fields are."""
+        self.assertEqual(
+            Leaf(_text="3 cm", start=0, end=4, length=3.0),
+            Leaf(_text="3.0 cm", start=0, end=4, length=3.0),
+        )
+        self.assertNotEqual(
+            Leaf(start=0, end=4, length=3.0), Leaf(start=0, end=4, length=4.0)
+        )
+
+    def test_base_rule_04(self) -> None:
+        """Traits of different classes are equal when their outputs are."""
+        self.assertEqual(
+            Leaf(start=0, end=4, length=3.0), Stem(start=0, end=4, length=3.0)
+        )
+        self.assertNotEqual(Leaf(start=0, end=4, length=3.0), Stem(start=0, end=4))
+        self.assertNotEqual(Leaf(start=0, end=4), "leaf")
@@ -4,7 +4,7 @@ from datetime import date
 from dateutil.relativedelta import relativedelta
 
 from tests.setup import parse
-from traiter.rules.date_ import Date
+from traiter.rules.date_ import Date, to_date
 
 
 class TestDate(unittest.TestCase):
@@ -291,3 +291,10 @@ class TestDate(unittest.TestCase):
                 ),
             ],
         )
+
+    def test_date_24(self) -> None:
+        """It assembles dates directly and falls back to dateutil for odd ones."""
+        today = date(2024, 6, 1)
+        self.assertEqual(to_date(("11", "May", "2004"), today), ("2004-05-11", None))
+        self.assertEqual(to_date(("20040511",), today), ("2004-05-11", None))
+        self.assertIsNone(to_date(("30", "February", "2004"), today))
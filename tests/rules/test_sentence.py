@@ -1,6 +1,9 @@
 import unittest
 
+from spacy.tokens import Doc
+
 from tests.setup import PIPELINE
+from traiter.pipes.sentence import Sentence
 from traiter.pylib.util import shorten
 
 
@@ -70,3 +73,16 @@ class TestSentence(unittest.TestCase):
         doc = PIPELINE(text)
         sents = list(doc.sents)
         self.assertEqual(len(sents), 1)
+
+    def test_sentencizer_10(self) -> None:
+        """It keeps the starts both recognizers agree on, even in a parsed doc."""
+        words = "a b . c d . e f".split()
+        doc = Doc(
+            PIPELINE.vocab,
+            words=words,
+            heads=[1, 1, 1, 4, 4, 4, 7, 7],
+            deps=["dep", "ROOT", "punct", "dep", "ROOT", "punct", "dep", "ROOT"],
+        )
+        doc_s = Doc(PIPELINE.vocab, words=words, sent_starts=[1, 0, 0, 0, 0, 0, 1, 0])
+        Sentence.set_starts(doc, doc, doc_s)
+        self.assertEqual([s.start for s in doc.sents], [0, 6])
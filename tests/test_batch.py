@@ -0,0 +1,36 @@
+import unittest
+
+from traiter.pylib import batch
+from traiter.pylib.result_cache import ResultCache
+
+RECORDS = [
+    ("a", "Collected 11 May 2004, red petals"),
+    ("b", "no traits here"),
+    ("c", "Elevation: 1463m"),
+] * 5
+
+
+class TestBatch(unittest.TestCase):
+    def test_batch_01(self) -> None:
+        """It keeps the records in order and labels each trait."""
+        results = list(batch.extract(RECORDS[:3], batch_size=2))
+        self.assertEqual([r[0] for r in results], ["a", "b", "c"])
+        self.assertEqual(
+            [t["trait"] for t in results[0][1]],
+            ["date", "color"],
+        )
+        self.assertEqual(results[1][1], [])
+
+    def test_batch_02(self) -> None:
+        """It gets the same results from worker processes."""
+        single = list(batch.extract(RECORDS, batch_size=2))
+        multi = list(batch.extract(RECORDS, batch_size=2, n_process=2))
+        self.assertEqual(single, multi)
+
+    def test_batch_03(self) -> None:
+        """It only parses texts that are not in the cache."""
+        with ResultCache() as cache:
+            cached = list(batch.extract(RECORDS, batch_size=2, cache=cache))
+            self.assertEqual(cache.misses, 3)
+            self.assertEqual(cache.hits, len(RECORDS) - 3)
+        self.assertEqual(cached, list(batch.extract(RECORDS, batch_size=2)))
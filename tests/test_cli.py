@@ -0,0 +1,88 @@
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from traiter import cli
+
+RECORDS = [
+    {"id": "a", "text": "Collected 11 May 2004"},
+    {"id": "b", "text": "red petals"},
+    {"id": "c", "text": "no traits"},
+    {"id": "d", "text": "Elevation: 1463m"},
+    {"id": "e", "text": "12 May 2001"},
+]
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.temp_dir.name)
+        self.input = self.dir / "labels.jsonl.gz"
+        self.output = self.dir / "traits.jsonl"
+        with gzip.open(self.input, "wt") as out:
+            out.writelines(json.dumps(r) + "\n" for r in RECORDS)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def read_output(self) -> list[dict]:
+        with self.output.open() as in_file:
+            return [json.loads(ln) for ln in in_file]
+
+    def test_cli_01(self) -> None:
+        """It extracts traits from a gzipped JSONL file."""
+        cli.main([str(self.input), str(self.output)])
+        lines = self.read_output()
+        self.assertEqual([ln["id"] for ln in lines], ["a", "b", "c", "d", "e"])
+        self.assertEqual([t["trait"] for t in lines[0]["traits"]], ["date"])
+        self.assertEqual(lines[2]["traits"], [])
+
+    def test_cli_02(self) -> None:
+        """It resumes from the last checkpoint."""
+        cli.main([str(self.input), str(self.output), "--checkpoint-every", "2"])
+        expect = self.read_output()
+
+        # Pretend it crashed after the 2nd checkpoint while writing the 5th record
+        checkpoint_path = self.dir / "traits.jsonl.checkpoint"
+        checkpoint = json.loads(checkpoint_path.read_text())
+        with self.output.open("rb") as in_file:
+            lines = in_file.readlines()
+        checkpoint["records"] = 4
+        checkpoint["output_bytes"] = sum(len(ln) for ln in lines[:4])
+        checkpoint_path.write_text(json.dumps(checkpoint))
+        with self.output.open("ab") as out:
+            out.write(b'{"id": "e", "tra')
+
+        cli.main([str(self.input), str(self.output), "--checkpoint-every", "2"])
+        self.assertEqual(self.read_output(), expect)
+
+    def test_cli_03(self) -> None:
+        """It won't resume if the output is gone."""
+        cli.main([str(self.input), str(self.output), "--checkpoint-every", "2"])
+        self.output.unlink()
+
+        error = ""
+        try:
+            cli.main([str(self.input), str(self.output)])
+        except SystemExit as err:
+            error = str(err)
+        self.assertIn("use --restart", error)
+
+        cli.main([str(self.input), str(self.output), "--restart"])
+        self.assertEqual(len(self.read_output()), len(RECORDS))
+
+    def test_cli_04(self) -> None:
+        """It won't resume with different options."""
+        cli.main([str(self.input), str(self.output), "--checkpoint-every", "2"])
+
+        error = ""
+        try:
+            cli.main([str(self.input), str(self.output), "--clean", "none"])
+        except SystemExit as err:
+            error = str(err)
+        self.assertIn("different --clean, use --restart", error)
+
+        cli.main([str(self.input), str(self.output), "--clean", "none", "--restart"])
+        self.assertEqual(len(self.read_output()), len(RECORDS))
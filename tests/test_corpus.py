@@ -0,0 +1,25 @@
+import unittest
+
+from benchmarks.corpus import make_corpus, make_ocr_pages
+from tests.setup import PIPELINE
+
+
+class TestCorpus(unittest.TestCase):
+    def test_corpus_01(self) -> None:
+        """It makes the same corpus for the same seed."""
+        self.assertEqual(make_corpus(20, seed=3), make_corpus(20, seed=3))
+        self.assertNotEqual(make_corpus(20, seed=3), make_corpus(20, seed=4))
+
+    def test_corpus_02(self) -> None:
+        """It exercises every trait."""
+        labels = {e.label_ for doc in PIPELINE.pipe(make_corpus(50)) for e in doc.ents}
+        self.assertLessEqual(
+            {"color", "date", "elevation", "habitat", "lat_long", "trs", "utm", "uuid"},
+            labels,
+        )
+
+    def test_corpus_03(self) -> None:
+        """It makes the same OCR pages for the same seed."""
+        pages = make_ocr_pages(2, seed=3, labels_per_page=10)
+        self.assertEqual(pages, make_ocr_pages(2, seed=3, labels_per_page=10))
+        self.assertEqual(len(pages), 2)
@@ -0,0 +1,17 @@
+import unittest
+
+from traiter.pylib import darwin_core
+from traiter.pylib.darwin_core import DarwinCore
+
+
+class TestDarwinCore(unittest.TestCase):
+    def test_darwin_core_01(self) -> None:
+        """The names file is up to date with the full term table."""
+        core, _ = darwin_core.read_dwc_terms()
+        self.assertEqual(darwin_core.dwc_names(), frozenset(core))
+
+    def test_darwin_core_02(self) -> None:
+        """It gets the namespace right."""
+        self.assertEqual(DarwinCore.ns("dc:license"), "dc:license")
+        self.assertEqual(DarwinCore.ns("verbatimElevation"), "dwc:verbatimElevation")
+        self.assertIn("dc:license", darwin_core.DUBLIN)
@@ -0,0 +1,38 @@
+import unittest
+
+from traiter.pylib import models, pipeline
+
+
+class TestModels(unittest.TestCase):
+    def test_models_01(self) -> None:
+        """Pipelines and their sentence pipes share one vocab and sub-models."""
+        nlp1 = pipeline.build()
+        nlp2 = pipeline.build()
+        sents1 = nlp1.get_pipe("sentences")
+        sents2 = nlp2.get_pipe("sentences")
+
+        self.assertIsNot(nlp1, nlp2)
+        self.assertIs(sents1.nlp_d, sents2.nlp_d)
+        self.assertIs(sents1.nlp_s, sents2.nlp_s)
+        self.assertIsNot(sents1.nlp_d, sents1.nlp_s)
+
+        vocab = models.vocab(pipeline.BASE_MODEL)
+        for nlp in (nlp1, nlp2, sents1.nlp_d, sents1.nlp_s):
+            self.assertIs(nlp.vocab, vocab)
+
+    def test_models_02(self) -> None:
+        """Clearing the registry loads new copies of the models."""
+        saved = dict(models.MODELS), dict(models.VOCABS)
+        self.addCleanup(models.VOCABS.update, saved[1])
+        self.addCleanup(models.MODELS.update, saved[0])
+
+        name = pipeline.RULES_ONLY
+        nlp = models.shared(name)
+        self.assertIs(models.shared(name), nlp)
+
+        models.clear()
+        self.assertEqual(models.MODELS, {})
+        self.assertEqual(models.VOCABS, {})
+
+        self.assertIsNot(models.shared(name), nlp)
+        self.assertIsNot(models.vocab(name), nlp.vocab)
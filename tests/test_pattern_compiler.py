@@ -0,0 +1,25 @@
+import unittest
+
+from spacy.matcher import Matcher
+
+from tests.setup import PIPELINE
+from traiter.pylib.pattern_compiler import flag_regexes
+
+
+class TestFlagRegexes(unittest.TestCase):
+    def test_flag_regexes_01(self) -> None:
+        patterns = [[{"TEXT": {"REGEX": r"^\d\d$"}}, {"LOWER": {"REGEX": r"^may$"}}]]
+        flagged = flag_regexes(PIPELINE.vocab, "test", patterns)
+        self.assertTrue(all(k.startswith("FLAG") for t in flagged[0] for k in t))
+
+        matcher = Matcher(PIPELINE.vocab, validate=False)
+        matcher.add("test", flagged)
+        doc = PIPELINE.make_doc("on 12 MAY 123 may")
+        self.assertEqual([(s, e) for _, s, e in matcher(doc)], [(1, 3)])
+
+    def test_flag_regexes_02(self) -> None:
+        patterns = [[{"TEXT": {"REGEX": r"^\d+$"}, "OP": "+"}]]
+        first = flag_regexes(PIPELINE.vocab, "test", patterns)
+        second = flag_regexes(PIPELINE.vocab, "test", patterns)
+        self.assertEqual(first, second)
+        self.assertEqual(first[0][0]["OP"], "+")
@@ -0,0 +1,69 @@
+import unittest
+
+from tests.setup import PIPELINE
+from traiter.pipes import pipe_util
+from traiter.pipes.pipe_util import Triggers, UsedTokens
+from traiter.pipes.reject_match import RejectMatch
+from traiter.pylib.pattern_compiler import flag_regexes
+
+
+class TestUsedTokens(unittest.TestCase):
+    def test_used_tokens_01(self) -> None:
+        doc = PIPELINE.make_doc("one two three four five")
+        used = UsedTokens(doc)
+        used.add(doc[1:3])
+        self.assertTrue(used.overlaps(doc[2:4]))
+        self.assertTrue(used.overlaps(doc[0:2]))
+
+    def test_used_tokens_02(self) -> None:
+        doc = PIPELINE.make_doc("one two three four five")
+        used = UsedTokens(doc)
+        used.add(doc[1:3])
+        self.assertFalse(used.overlaps(doc[0:1]))
+        self.assertFalse(used.overlaps(doc[3:5]))
+
+
+class TestTriggers(unittest.TestCase):
+    def test_triggers_01(self) -> None:
+        patterns = {"elevation": [[{"ENT_TYPE": "elev_label"}, {"IS_DIGIT": True}]]}
+        triggers = Triggers(PIPELINE.vocab, patterns)
+        doc = PIPELINE.make_doc("elev 1200")
+        self.assertFalse(triggers.may_match(doc))
+        doc.ents = [doc.char_span(0, 4, label="elev_label")]
+        self.assertTrue(triggers.may_match(doc))
+
+    def test_triggers_02(self) -> None:
+        patterns = {"number": [[{"ENT_TYPE": "number_word", "OP": "?"}]]}
+        triggers = Triggers(PIPELINE.vocab, patterns)
+        self.assertTrue(triggers.always)
+
+    def test_triggers_03(self) -> None:
+        """Regexes turned into lexeme flags are checked like any other flag."""
+        patterns = [[{"TEXT": {"REGEX": r"^\d+$"}}, {"LOWER": "ft"}]]
+        patterns = {"height": flag_regexes(PIPELINE.vocab, "height", patterns)}
+        triggers = Triggers(PIPELINE.vocab, patterns)
+        self.assertFalse(triggers.always)
+        self.assertFalse(triggers.may_match(PIPELINE.make_doc("no digits ft")))
+        self.assertTrue(triggers.may_match(PIPELINE.make_doc("12 ft")))
+
+
+class TestDispatch(unittest.TestCase):
+    def test_dispatch_01(self) -> None:
+        """Batch callbacks get all of a label's matches in one call."""
+        docs = [PIPELINE.make_doc("one two three"), PIPELINE.make_doc("four five")]
+        batch = [
+            [docs[0].char_span(0, 3, label="a"), docs[0].char_span(4, 7, label="b")],
+            [docs[1].char_span(0, 4, label="a")],
+        ]
+        calls = []
+
+        def batch_a(spans: list) -> list:
+            calls.append([s.text for s in spans])
+            return [s.text if s.text != "four" else None for s in spans]
+
+        def reject_b(_: object) -> None:
+            raise RejectMatch
+
+        traits = pipe_util.dispatch(batch, {"b": reject_b}, {"a": batch_a})
+        self.assertEqual(calls, [["one", "four"]])
+        self.assertEqual(traits, [["one", pipe_util.REJECTED], [pipe_util.REJECTED]])
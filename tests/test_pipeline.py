@@ -0,0 +1,108 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.setup import PIPELINE
+from traiter.pylib import pipeline
+from traiter.pylib.batch import doc_traits
+
+
+class TestPipeline(unittest.TestCase):
+    def test_pipeline_01(self) -> None:
+        """A rules-only pipeline has no model components but still finds traits."""
+        nlp = pipeline.build(base_model=pipeline.RULES_ONLY)
+        self.assertNotIn("parser", nlp.pipe_names)
+        self.assertNotIn("sentences", nlp.pipe_names)
+        self.assertEqual(
+            doc_traits(nlp("Elev. 400 ft.")),
+            [
+                {
+                    "trait": "elevation",
+                    "start": 0,
+                    "end": 12,
+                    "elevation": 121.92,
+                    "units": "m",
+                }
+            ],
+        )
+
+    def test_pipeline_02(self) -> None:
+        """The numerical pipeline only needs a tokenizer."""
+        nlp = pipeline.numerical()
+        self.assertTrue(all(n.startswith("number") for n in nlp.pipe_names))
+
+    def test_pipeline_03(self) -> None:
+        """It only adds the rules asked for and the rules they need."""
+        self.assertEqual(pipeline.rule_names(["color"]), ["color"])
+        self.assertEqual(
+            pipeline.rule_names(["trs"]),
+            ["uuid", "date", "elevation", "lat_long", "trs"],
+        )
+
+    def test_pipeline_04(self) -> None:
+        """A pipeline with some rules skips the sentences and the other rules."""
+        nlp = pipeline.build(rules=["elevation"])
+        self.assertNotIn("sentences", nlp.pipe_names)
+        self.assertNotIn("color_patterns", nlp.pipe_names)
+        traits = doc_traits(nlp("Color red. Elev. 400 ft."))
+        self.assertEqual([t["trait"] for t in traits], ["elevation"])
+
+    def test_pipeline_05(self) -> None:
+        """It finds the same traits in batches of docs as one doc at a time."""
+        nlp = pipeline.build()
+        texts = [
+            "Collected 11 May 2004, red petals",
+            "no traits here",
+            "Elev. 400 ft. 5/6/1999",
+            "Jan 2001",
+        ]
+        self.assertEqual(
+            [doc_traits(d) for d in nlp.pipe(texts, batch_size=3)],
+            [doc_traits(nlp(t)) for t in texts],
+        )
+
+    def test_pipeline_06(self) -> None:
+        """Sentences can come from the pipeline's own parser and senter."""
+        nlp = pipeline.build(host_sentences=True)
+        self.assertEqual(
+            nlp.pipe_names.index("sentences"), 1 + nlp.pipe_names.index("parser")
+        )
+        self.assertIs(nlp.get_pipe("sentences").nlp_s, nlp.get_pipe("senter"))
+
+        text = "It was common along a tiny stream. Argia apicalis."
+        want = [s.text for s in PIPELINE(text).sents]
+        self.assertEqual([s.text for s in nlp(text).sents], want)
+        self.assertEqual([s.text for s in next(nlp.pipe([text])).sents], want)
+
+    def test_pipeline_07(self) -> None:
+        """A pipeline loaded from the cache finds the same traits as a new one."""
+        texts = [
+            "Lat: 41.01102 Long: -75.485306 (WGS-84)",
+            "Collected 11 May 2004, red petals. Elev. 400 ft.",
+        ]
+        want = [doc_traits(PIPELINE(t)) for t in texts]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            pipeline.build(cache_dir)
+            nlp = pipeline.build(cache_dir)
+            self.assertEqual([doc_traits(nlp(t)) for t in texts], want)
+
+    def test_pipeline_08(self) -> None:
+        """It keeps a cached pipeline that another process saved first."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            pipeline.cached(
+                cache_dir,
+                "numerical",
+                lambda: pipeline.numerical(cache_dir),  # Saves it before we do
+                base_model=pipeline.RULES_ONLY,
+            )
+            self.assertEqual(len(list(Path(cache_dir).iterdir())), 1)
+
+    def test_pipeline_09(self) -> None:
+        """Cached pipelines with different rules or sentences are kept apart."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            pipeline.build(cache_dir)
+            nlp = pipeline.build(cache_dir, sentences=False)
+            self.assertNotIn("sentences", nlp.pipe_names)
+            nlp = pipeline.build(cache_dir, rules=[])
+            self.assertNotIn("color_patterns", nlp.pipe_names)
+            self.assertEqual(len(list(Path(cache_dir).iterdir())), 3)
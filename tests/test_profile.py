@@ -0,0 +1,39 @@
+import time
+import unittest
+
+from tests.setup import PIPELINE
+from traiter.pipes import profile
+
+
+class TestProfiler(unittest.TestCase):
+    def test_profiler_01(self) -> None:
+        """It records every pipe and puts the components back afterwards."""
+        pipe_names = list(PIPELINE.pipe_names)
+        components = list(PIPELINE.components)
+        with profile.Profiler(PIPELINE) as profiler:
+            PIPELINE("Collected 11 May 2004")
+            list(PIPELINE.pipe(["12 May 2001", "red petals"]))
+
+        self.assertEqual(PIPELINE.pipe_names, pipe_names)
+        self.assertEqual(PIPELINE.components, components)
+        self.assertEqual(list(profiler.stats), pipe_names)
+        self.assertEqual({s.calls for s in profiler.stats.values()}, {3})
+
+        stats = profiler.stats["date_patterns"]
+        self.assertGreaterEqual(stats.matches, 2)
+        self.assertEqual(stats.ents_out, 3)  # 2 dates and a color
+
+    def test_profiler_02(self) -> None:
+        """It counts rejected matches."""
+        with profile.Profiler(PIPELINE) as profiler:
+            PIPELINE("Collected 31 Feb 2004")
+        self.assertEqual(profiler.stats["date_patterns"].rejected, 1)
+
+    def test_profiler_03(self) -> None:
+        """It does not charge the time spent consuming docs to a pipe."""
+        texts = ["Collected 11 May 2004"] * 4
+        with profile.Profiler(PIPELINE) as profiler:
+            for _ in PIPELINE.pipe(texts, batch_size=2):
+                time.sleep(0.1)
+        self.assertEqual({s.calls for s in profiler.stats.values()}, {4})
+        self.assertLess(sum(s.seconds for s in profiler.stats.values()), 0.2)
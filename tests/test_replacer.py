@@ -0,0 +1,20 @@
+import unittest
+
+from traiter.pylib import replacer
+
+
+class TestReplacer(unittest.TestCase):
+    def test_replacer_01(self) -> None:
+        """The longest match wins."""
+        replace = replacer.compile_replacements({"a": "1", "ab": "2", "abc": "3"})
+        self.assertEqual(replace("abcab a.b"), "32 1.b")
+
+    def test_replacer_02(self) -> None:
+        """Replaced text is not replaced again."""
+        replace = replacer.compile_replacements({"cat": "dog", "dog": "cat"})
+        self.assertEqual(replace("cat dog"), "dog cat")
+
+    def test_replacer_03(self) -> None:
+        """Regex characters are taken literally."""
+        replace = replacer.compile_replacements({"a.b": "x", "(c)": "y", "": "z"})
+        self.assertEqual(replace("a.b acb (c)"), "x acb y")
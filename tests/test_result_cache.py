@@ -0,0 +1,44 @@
+import functools
+import tempfile
+import unittest
+from pathlib import Path
+
+from traiter.pylib import pipeline
+from traiter.pylib.result_cache import ResultCache
+
+TRAITS = [{"trait": "color", "start": 0, "end": 3, "color": "red"}]
+
+
+class TestResultCache(unittest.TestCase):
+    def test_result_cache_01(self) -> None:
+        """It drops the least recently used results from memory."""
+        cache = ResultCache(max_size=2)
+        cache.put("a", TRAITS)
+        cache.put("b", [])
+        cache.get("a")
+        cache.put("c", [])
+        self.assertEqual(cache.get("a"), TRAITS)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_result_cache_02(self) -> None:
+        """It keeps results on disk between runs but not between pipelines."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "results.sqlite"
+            with ResultCache(pipeline.build, path) as cache:
+                cache.put("red", TRAITS)
+            with ResultCache(pipeline.build, path) as cache:
+                self.assertEqual(cache.get("red"), TRAITS)
+            with ResultCache(pipeline.numerical, path) as cache:
+                self.assertIsNone(cache.get("red"))
+
+    def test_result_cache_03(self) -> None:
+        """It keys the results by the builder's config but not its cache directory."""
+        build = ResultCache(pipeline.build)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cached = ResultCache(functools.partial(pipeline.build, Path(temp_dir)))
+        self.assertEqual(build.key("red"), cached.key("red"))
+
+        for kwargs in ({"base_model": pipeline.RULES_ONLY}, {"rules": ["color"]}):
+            other = ResultCache(functools.partial(pipeline.build, **kwargs))
+            self.assertNotEqual(build.key("red"), other.key("red"))
@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from traiter.pylib import term_store, term_util
+
+TERMS = Path(__file__).parents[1] / "traiter" / "rules" / "terms"
+
+
+class TestTermStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.addCleanup(term_store.STORES.clear)
+        self.addCleanup(term_util.clear_terms)
+        term_util.clear_terms()
+        self.addCleanup(setattr, term_util, "TERM_STORE_DIR", None)
+        term_util.TERM_STORE_DIR = self.temp_dir.name
+
+    def test_term_store_01(self) -> None:
+        """It gets the same look up tables as the CSV files."""
+        path = TERMS / "unit_length_terms.csv"
+        terms = term_util.read_terms(path)
+        for field in ("label", "replace", "factor_cm"):
+            self.assertEqual(
+                term_util.look_up_table(path, field),
+                term_util.term_patterns(terms, field),
+            )
+
+    def test_term_store_02(self) -> None:
+        """It searches big tables in the memory map."""
+        path = TERMS / "color_terms.csv"
+        want = term_util.term_patterns(term_util.read_terms(path), "replace")
+        table = term_util.compiled_store(path).table("replace", small_table=0)
+        self.assertIsInstance(table, term_store.TermTable)
+        self.assertEqual(dict(table.items()), want)
+        self.assertNotIn("not a color", table)
+
+    def test_term_store_03(self) -> None:
+        """It recompiles a store when its source changes."""
+        path = Path(self.temp_dir.name) / "test_terms.csv"
+        path.write_text("label,pattern,replace\ncolor,reddish,red\n")
+        self.assertEqual(term_util.look_up_table(path, "replace"), {"reddish": "red"})
+
+        term_store.STORES.clear()
+        term_util.clear_terms()
+        path.write_text("label,pattern,replace\ncolor,bluish,blue\n")
+        self.assertIsNone(term_store.open_store(path, self.temp_dir.name))
+        self.assertEqual(term_util.look_up_table(path, "replace"), {"bluish": "blue"})
+
+    def test_term_store_04(self) -> None:
+        """Term files with the same name in different directories get their own."""
+        tables = {}
+        for dir_, term in (("a", "reddish"), ("b", "bluish")):
+            path = Path(self.temp_dir.name) / dir_ / "test_terms.csv"
+            path.parent.mkdir()
+            path.write_text(f"label,pattern,replace\ncolor,{term},{term[:-3]}\n")
+            tables[dir_] = term_util.look_up_table(path, "replace")
+
+        term_store.STORES.clear()
+        for dir_, table in tables.items():
+            path = Path(self.temp_dir.name) / dir_ / "test_terms.csv"
+            store = term_store.open_store(path, self.temp_dir.name)
+            self.assertIsNotNone(store)
+            self.assertEqual(store.table("replace"), table)
+
+    def test_term_store_05(self) -> None:
+        """Workers can compile the same store at the same time."""
+        path = Path(self.temp_dir.name) / "test_terms.csv"
+        path.write_text("label,pattern,replace\ncolor,reddish,red\n")
+        tables = {"replace": {"reddish": "red"}}
+
+        with ThreadPoolExecutor(8) as executor:
+            futures = [
+                executor.submit(
+                    term_store.compile_store, path, self.temp_dir.name, tables
+                )
+                for _ in range(32)
+            ]
+            stores = [f.result() for f in futures]
+
+        self.assertEqual(
+            {s.source_hash for s in stores}, {term_store.source_hash(path)}
+        )
+        store_path = term_store.store_path(path, self.temp_dir.name)
+        files = sorted(p.name for p in Path(self.temp_dir.name).glob("test_terms*"))
+        self.assertEqual(files, sorted([store_path.name, "test_terms.csv"]))
@@ -0,0 +1,59 @@
+import unittest
+from types import MappingProxyType
+
+from traiter.pipes import phrase
+from traiter.pylib import pipeline, term_util
+from traiter.rules.elevation import Elevation
+from traiter.rules.lat_long import LatLong
+
+
+class TestTermUtil(unittest.TestCase):
+    def test_term_util_01(self) -> None:
+        """Rules that use the same term file share its look up tables."""
+        self.assertIs(
+            term_util.look_up_table(LatLong.unit_csv, "factor_cm", float),
+            term_util.look_up_table([Elevation.unit_csv], "factor_cm", float),
+        )
+        self.assertIs(
+            term_util.term_file(LatLong.unit_csv),
+            term_util.term_file(Elevation.unit_csv),
+        )
+
+    def test_term_util_02(self) -> None:
+        """Phrase pipes share the pattern docs only while a pipeline is built."""
+        nlp = pipeline.build()
+        patterns = [{"label": "units", "pattern": "feet"}]
+        with phrase.shared_phrases(nlp):
+            docs1 = phrase.build_phrases(nlp, patterns)
+            docs2 = phrase.build_phrases(nlp, patterns)
+        self.assertIs(docs1["units"][0], docs2["units"][0])
+        self.assertNotIn(nlp, phrase.PHRASE_DOCS)
+
+        docs3 = phrase.build_phrases(nlp, patterns)
+        self.assertIsNot(docs3["units"][0], docs1["units"][0])
+
+    def test_term_util_03(self) -> None:
+        """Look up tables are read only."""
+        table = term_util.look_up_table(LatLong.unit_csv, "factor_cm", float)
+        self.assertIsInstance(table, MappingProxyType)
+        self.assertIsInstance(LatLong.factors_cm, MappingProxyType)
+
+    def test_term_util_04(self) -> None:
+        """Phrase pipes wait for the tokenizer to be set up to build their matchers."""
+        nlp = pipeline.numerical()
+        config = {"patterns": [{"label": "units", "pattern": "feet"}]}
+        pipe = nlp.add_pipe(phrase.PHRASE_PIPE, name="test_terms", config=config)
+        self.assertIsNone(pipe.matcher)
+        phrase.build_matchers(nlp)
+        self.assertIsNotNone(pipe.matcher)
+
+    def test_term_util_05(self) -> None:
+        """Terms that are read can be changed without changing the shared ones."""
+        terms = term_util.read_terms(LatLong.unit_csv)
+        terms[0]["pattern"] = "changed"
+        self.assertNotEqual(
+            term_util.read_terms(LatLong.unit_csv)[0]["pattern"], "changed"
+        )
+        self.assertIsInstance(
+            term_util.term_file(LatLong.unit_csv)[0], MappingProxyType
+        )
@@ -1,5 +1,7 @@
 import unittest
 
+import spacy
+
 from tests.setup import PIPELINE
 from traiter.pipes import tokenizer
 
@@ -12,3 +14,12 @@ class TestTokenizer(unittest.TestCase):
         tokenizer.remove_special_case(PIPELINE, ["Jan."])
         special = [r for r in PIPELINE.tokenizer.rules if r == "Jan."]
         assert special == []
+
+    def test_setup_tokenizer_01(self) -> None:
+        """The set up tokenizer can be saved and reused."""
+        nlp = spacy.blank("en")
+        nlp.tokenizer.from_bytes(PIPELINE.tokenizer.to_bytes())
+        self.assertEqual(nlp.tokenizer.rules, PIPELINE.tokenizer.rules)
+
+        text = "Sp. nov. 8m x3 10-12 Ala. don't"
+        self.assertEqual([t.text for t in nlp(text)], [t.text for t in PIPELINE(text)])
@@ -0,0 +1,42 @@
+import unittest
+
+from traiter.pylib import util
+
+
+class TestUtil(unittest.TestCase):
+    def test_clean_text_01(self) -> None:
+        """It still fixes mojibake and curly quotes."""
+        self.assertEqual(util.clean_text("cafÃ© ’s"), "café 's")
+
+    def test_clean_text_02(self) -> None:
+        """It skips ftfy for clean text."""
+        self.assertFalse(util.needs_ftfy("Elev. 1,200 ft. 12-V-1999"))
+        self.assertFalse(util.needs_ftfy("38°N café"))
+        self.assertTrue(util.needs_ftfy("Tom &amp; Jerry"))
+        self.assertTrue(util.needs_ftfy("cafÃ©"))
+
+    def test_clean_text_03(self) -> None:
+        """It translates and then replaces the longest matches in one pass."""
+        trans = {ord("ſ"): "s"}
+        replace = {"s": "z", "ss": "S", "z": "s"}
+        self.assertEqual(
+            util.clean_text("baſ kiſſ fizz", trans, replace), "baz kiS fiss"
+        )
+
+    def test_clean_text_04(self) -> None:
+        """It folds single character replacements into the translation table."""
+        cleaner = util.TextCleaner({ord("ſ"): "s"}, {"s": "z", "z": "s"})
+        self.assertIsNone(cleaner.replace)
+        self.assertEqual(cleaner("baſ fizz"), "baz fiss")
+
+    def test_clean_text_05(self) -> None:
+        """It builds a new cleaner when replacements are added."""
+        replace = {"teh": "the"}
+        self.assertEqual(util.clean_text("teh cat", replace=replace), "the cat")
+        replace["cat"] = "dog"
+        self.assertEqual(util.clean_text("teh cat", replace=replace), "the dog")
+
+    def test_clean_texts_01(self) -> None:
+        """It cleans a stream of texts."""
+        texts = util.clean_texts(["  red  ", "flow-\ners"])
+        self.assertEqual(list(texts), ["red", "flowers"])
@@ -0,0 +1,314 @@
+"""
+Extract traits from JSONL, CSV, or text files.
+
+    traiter labels.jsonl.gz traits.jsonl --n-process 8
+
+Records are read and written as a stream, so memory use does not depend on the size
+of the input. Progress is saved to a checkpoint file next to the output every so
+often, and running the same command again after a crash resumes from the last
+checkpoint.
+"""
+
+import argparse
+import contextlib
+import csv
+import functools
+import gzip
+import io
+import itertools
+import json
+import os
+import sys
+import textwrap
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+from traiter.pylib import batch, pipeline, util
+from traiter.pylib.result_cache import ResultCache
+
+FORMATS = ("jsonl", "csv", "txt")
+PIPELINES = {"build": pipeline.build, "numerical": pipeline.numerical}
+CLEANERS = {"clean": util.clean_text, "compress": util.compress, "none": None}
+
+# The arguments that change the output, a checkpoint is only resumed if they match
+OPTIONS = (
+    "format",
+    "id_field",
+    "text_field",
+    "pipeline",
+    "rules",
+    "base_model",
+    "clean",
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    checkpoint_path = args.output.with_name(f"{args.output.name}.checkpoint")
+    checkpoint = load_checkpoint(args, checkpoint_path)
+
+    builder = functools.partial(PIPELINES[args.pipeline], args.cache_dir)
+    if args.base_model:
+        builder = functools.partial(builder, base_model=args.base_model)
+    if args.rules:
+        if args.pipeline != "build":
+            sys.exit("--rules only works with the build pipeline")
+        rules = pipeline.rule_names(args.rules)
+        builder = functools.partial(builder, rules=rules)
+
+    records = read_records(args.input, args.format, args.id_field, args.text_field)
+    records = itertools.islice(records, checkpoint["records"], None)
+
+    cache = None
+    if args.result_cache or args.cache_size:
+        cache = ResultCache(builder, args.result_cache, args.cache_size)
+
+    results = batch.extract(
+        records,
+        builder=builder,
+        clean=CLEANERS[args.clean],
+        batch_size=args.batch_size,
+        n_process=args.n_process,
+        cache=cache,
+    )
+
+    start = checkpoint["records"]
+    mode = "r+b" if checkpoint["output_bytes"] else "wb"
+
+    with args.output.open(mode) as out, cache or contextlib.nullcontext():
+        # Drop anything written after the last checkpoint
+        out.seek(checkpoint["output_bytes"])
+        out.truncate()
+
+        done = 0
+        for id_, traits in results:
+            line = json.dumps({"id": id_, "traits": traits}) + "\n"
+            out.write(line.encode("utf8"))
+
+            done += 1
+            if done % args.checkpoint_every == 0:
+                save_checkpoint(
+                    checkpoint_path, checkpoint | {"records": start + done}, out
+                )
+
+        save_checkpoint(checkpoint_path, checkpoint | {"records": start + done}, out)
+
+
+def load_checkpoint(args: argparse.Namespace, checkpoint_path: Path) -> dict[str, Any]:
+    """Get where to resume from, as long as the input and options are the same."""
+    input_info = {"input": str(args.input), "size": args.input.stat().st_size}
+    options = {k: getattr(args, k) for k in OPTIONS}
+
+    checkpoint = {"records": 0, "output_bytes": 0} | input_info | options
+    if not checkpoint_path.exists() or args.restart:
+        return checkpoint
+
+    checkpoint = json.loads(checkpoint_path.read_text())
+    if {k: checkpoint.get(k) for k in input_info} != input_info:
+        msg = f"{checkpoint_path} is for a different input, use --restart to start over"
+        sys.exit(msg)
+
+    if changed := [k for k, v in options.items() if checkpoint.get(k) != v]:
+        flags = ", ".join(f"--{k.replace('_', '-')}" for k in changed)
+        msg = (
+            f"{checkpoint_path} was made with a different {flags}, "
+            "use --restart to start over"
+        )
+        sys.exit(msg)
+
+    output_bytes = args.output.stat().st_size if args.output.exists() else -1
+    if output_bytes < checkpoint["output_bytes"]:
+        msg = (
+            f"{args.output} is missing or shorter than {checkpoint_path} "
+            "expects, use --restart to start over"
+        )
+        sys.exit(msg)
+
+    return checkpoint
+
+
+def save_checkpoint(path: Path, checkpoint: dict[str, Any], out: BinaryIO) -> None:
+    """Save the progress only after the output up to that point is on disk."""
+    out.flush()
+    os.fsync(out.fileno())
+    checkpoint["output_bytes"] = out.tell()
+
+    temp = path.with_suffix(".tmp")
+    temp.write_text(json.dumps(checkpoint))
+    temp.replace(path)
+
+
+def read_records(
+    path: Path, format_: str | None, id_field: str, text_field: str
+) -> Iterator[batch.Record]:
+    """Read (id, text) records, the IDs default to the record number."""
+    format_ = format_ or guess_format(path)
+
+    with open_text(path) as in_file:
+        match format_:
+            case "jsonl":
+                rows = (json.loads(ln) for ln in in_file if ln.strip())
+            case "csv":
+                rows = csv.DictReader(in_file)
+            case _:
+                rows = ({text_field: ln.rstrip("\n")} for ln in in_file)
+
+        for i, row in enumerate(rows, 1):
+            yield row.get(id_field, i), row.get(text_field) or ""
+
+
+def open_text(path: Path) -> TextIO:
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.open(path), encoding="utf8", newline="")
+    return path.open(encoding="utf8", newline="")
+
+
+def guess_format(path: Path) -> str:
+    suffixes = [s for s in path.suffixes if s != ".gz"]
+    format_ = suffixes[-1].lstrip(".") if suffixes else ""
+    if format_ not in FORMATS:
+        msg = f"Cannot tell the format of {path}, use --format"
+        raise ValueError(msg)
+    return format_
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        prog="traiter",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=textwrap.dedent(
+            """
+            Extract traits from a JSONL, CSV, or text file, which may be gzipped.
+            The traits are written as JSONL with one line per input record. If the
+            run is interrupted then running it again will resume where it stopped.
+            """
+        ),
+    )
+
+    arg_parser.add_argument(
+        "input",
+        type=Path,
+        help="""Read records from this file.""",
+    )
+
+    arg_parser.add_argument(
+        "output",
+        type=Path,
+        help="""Write the traits to this JSONL file.""",
+    )
+
+    arg_parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="""The input format. The default is to use the file extension.""",
+    )
+
+    arg_parser.add_argument(
+        "--id-field",
+        default="id",
+        metavar="FIELD",
+        help="""The JSONL or CSV field with the record ID. The record number is
+            used if it is missing. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--text-field",
+        default="text",
+        metavar="FIELD",
+        help="""The JSONL or CSV field with the text. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--pipeline",
+        choices=list(PIPELINES),
+        default="build",
+        help="""Which pipeline to run. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--rules",
+        nargs="+",
+        choices=list(pipeline.RULES),
+        metavar="RULE",
+        help="""Only add these rules, and the rules they need, to the build pipeline.
+            The default is all of them. Choose from: %(choices)s""",
+    )
+
+    arg_parser.add_argument(
+        "--base-model",
+        metavar="MODEL",
+        help=f"""Build the pipeline on this spaCy model. Use {pipeline.RULES_ONLY} for
+            just a tokenizer, which is faster but has no parts of speech or
+            sentences. The default is {pipeline.BASE_MODEL} for the build pipeline and
+            {pipeline.RULES_ONLY} for the numerical one.""",
+    )
+
+    arg_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        metavar="DIR",
+        help="""Cache the built pipeline here so it loads faster next time.""",
+    )
+
+    arg_parser.add_argument(
+        "--result-cache",
+        type=Path,
+        metavar="PATH",
+        help="""Save the traits for each distinct text in this SQLite file and reuse
+            them across runs.""",
+    )
+
+    arg_parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=100_000,
+        metavar="INT",
+        help="""Keep the traits for this many recent distinct texts in memory, so
+            duplicate texts are only parsed once. Set to 0 to turn this off.
+            (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--clean",
+        choices=list(CLEANERS),
+        default="clean",
+        help="""How to clean the text before extraction. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=128,
+        metavar="INT",
+        help="""Records per batch. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--n-process",
+        type=int,
+        default=1,
+        metavar="INT",
+        help="""How many processes to use. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=1000,
+        metavar="INT",
+        help="""Save progress after this many records. (default: %(default)s)""",
+    )
+
+    arg_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="""Ignore any checkpoint and start from the beginning.""",
+    )
+
+    return arg_parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@ traits. It is based on traits so you the new trait must be a previous phrase or
 trait match.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 from spacy import util
@@ -15,7 +15,9 @@ from spacy.language import Language
 from spacy.matcher import Matcher
 from spacy.tokens import Doc, Span
 
-from traiter.pipes.reject_match import RejectMatch, SkipTraitCreation
+from traiter.pipes import pipe_util, profile
+from traiter.pipes.pipe_util import Triggers
+from traiter.pylib.pattern_compiler import flag_regexes
 
 CONTEXT_TRAITS = "context_traits"
 
@@ -37,7 +39,10 @@ class ContextTraits:
         self.overwrite = overwrite
 
         self.dispatch_table = self.build_dispatch_table()
+        self.batch_table = self.build_batch_table()
+        self.flagged = self.flag_patterns()
         self.matcher = self.build_matcher()
+        self.triggers = Triggers(self.nlp.vocab, self.flagged)
 
     def build_dispatch_table(self) -> dict[str, Callable]:
         dispatch_table = {}
@@ -47,47 +52,78 @@ class ContextTraits:
                     dispatch_table[label] = func
         return dispatch_table
 
+    def build_batch_table(self) -> dict[str, Callable]:
+        batch_table = {}
+        if self.dispatch:
+            for label, registered in self.dispatch.items():
+                if (batched := registered + pipe_util.BATCH) in util.registry.misc:
+                    batch_table[label] = util.registry.misc.get(batched)
+        return batch_table
+
+    def flag_patterns(self) -> dict[str, list[list[dict[str, Any]]]]:
+        return {
+            label: flag_regexes(self.nlp.vocab, label, patterns)
+            for label, patterns in self.patterns.items()
+        }
+
     def build_matcher(self) -> Matcher:
-        matcher = Matcher(self.nlp.vocab)
-        for label, patterns in self.patterns.items():
+        matcher = Matcher(self.nlp.vocab, validate=False)  # Validated when flagged
+        for label, patterns in self.flagged.items():
             matcher.add(label, patterns, greedy="FIRST")
         return matcher
 
     def __call__(self, doc: Doc) -> Doc:
-        matches = self.matcher(doc, as_spans=True)
-
-        matches = util.filter_spans(matches)
-        if not matches:
-            return doc
-        entities = doc.ents
-
-        for match in matches:
-            trait = None
-            if action := self.dispatch_table.get(match.label_):
-                try:
-                    trait = action(match)
-                except (RejectMatch, SkipTraitCreation):
+        self.add_traits([doc])
+        return doc
+
+    def pipe(self, stream: Iterable[Doc], batch_size: int = 128) -> Iterator[Doc]:
+        for docs in util.minibatch(stream, size=batch_size):
+            self.add_traits(docs)
+            yield from docs
+
+    def add_traits(self, docs: list[Doc]) -> None:
+        batch = []
+        for doc in docs:
+            if not self.triggers.may_match(doc):
+                continue
+            if matches := util.filter_spans(self.matcher(doc, as_spans=True)):
+                batch.append((doc, matches))
+
+        traits = pipe_util.dispatch(
+            [m for _, m in batch], self.dispatch_table, self.batch_table
+        )
+
+        for (doc, matches), doc_traits in zip(batch, traits, strict=True):
+            entities = doc.ents
+            rejected = 0
+
+            for match, trait in zip(matches, doc_traits, strict=True):
+                if trait is pipe_util.REJECTED:
+                    rejected += 1
                     continue
 
-            # Create a new trait
-            sub_ents = [
-                e
-                for e in entities
-                if e.label_ in self.overwrite
-                and trait.start <= e.start_char < trait.end
-            ]
-            span = Span(doc, sub_ents[0].start, sub_ents[-1].end, label=match.label_)
-            entities = [
-                e for e in entities if e.start < span.start or e.start >= span.end
-            ]
-            entities.append(span)
-
-            trait.start = span.start_char
-            trait.end = span.end_char
-            trait._text = span.text
-            trait._trait = match.label_
-            span._.trait = trait
-
-        entities = sorted(entities, key=lambda e: e.start)
-        doc.set_ents(entities, default="unmodified")
-        return doc
+                # Create a new trait
+                sub_ents = [
+                    e
+                    for e in entities
+                    if e.label_ in self.overwrite
+                    and trait.start <= e.start_char < trait.end
+                ]
+                span = Span(
+                    doc, sub_ents[0].start, sub_ents[-1].end, label=match.label_
+                )
+                entities = [
+                    e for e in entities if e.start < span.start or e.start >= span.end
+                ]
+                entities.append(span)
+
+                trait.start = span.start_char
+                trait.end = span.end_char
+                trait._text = span.text
+                trait._trait = match.label_
+                span._.trait = trait
+
+            profile.count(self.name, matches=len(matches), rejected=rejected)
+
+            entities = sorted(entities, key=lambda e: e.start)
+            doc.set_ents(entities, default="unmodified")
@@ -1,15 +1,68 @@
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from weakref import WeakKeyDictionary
 
 from spacy.language import Language
 from spacy.matcher import PhraseMatcher
 from spacy.tokens import Doc
 from spacy.util import filter_spans
 
+from . import profile
+from .pipe_util import UsedTokens
+
 PHRASE_PIPE = "phrase_pipe"
 
+# Term files are used by several rules, so while the phrase matchers are being built
+# each pattern is only tokenized once and the docs are shared by all of the matchers.
+# The docs are dropped when the matchers are done, the matchers keep their own copies.
+PHRASE_DOCS: WeakKeyDictionary[Language, dict[str, Doc]] = WeakKeyDictionary()
+
+
+@contextmanager
+def shared_phrases(nlp: Language) -> Iterator[None]:
+    """Share the pattern docs between the phrase matchers built in this block."""
+    PHRASE_DOCS[nlp] = {}
+    try:
+        yield
+    finally:
+        PHRASE_DOCS.pop(nlp, None)
+
+
+def build_matchers(nlp: Language) -> None:
+    """
+    Build the matchers for all of the phrase pipes in a pipeline.
+
+    Call this once the tokenizer is set up. The patterns are tokenized with it, and a
+    loaded pipeline only gets its saved tokenizer back after its pipes are created.
+    """
+    with shared_phrases(nlp):
+        for _, pipe in nlp.components:
+            if isinstance(pipe, PhrasePipe) and pipe.matcher is None:
+                pipe.matcher = pipe.build_matcher()
+
+
+def build_phrases(nlp: Language, patterns: list[dict]) -> dict[str, list[Doc]]:
+    """Group the term patterns by label and tokenize them."""
+    docs = PHRASE_DOCS.get(nlp, {})
+    by_label = defaultdict(list)
+    for term in patterns:
+        pattern = term["pattern"]
+        if (doc := docs.get(pattern)) is None:
+            doc = docs[pattern] = nlp.make_doc(pattern)
+        by_label[term["label"]].append(doc)
+    return by_label
+
 
 @Language.factory(PHRASE_PIPE)
 class PhrasePipe:
+    """
+    Add entities for term patterns.
+
+    The matcher is built by build_matchers(), or else on the first doc, so that the
+    patterns are tokenized with the pipeline's final tokenizer.
+    """
+
     def __init__(
         self,
         nlp: Language,
@@ -22,44 +75,39 @@ class PhrasePipe:
         self.patterns = patterns
         self.attr = attr
 
-        self.matcher = self.build_matcher()
+        self.matcher: PhraseMatcher | None = None
 
     def build_matcher(self) -> PhraseMatcher:
         matcher = PhraseMatcher(self.nlp.vocab, attr=self.attr.upper())
 
-        by_label = defaultdict(list)
-        for term in self.patterns:
-            by_label[term["label"]].append(term)
-
-        for label, term_list in by_label.items():
-            phrases = [self.nlp.make_doc(t["pattern"]) for t in term_list]
+        for label, phrases in build_phrases(self.nlp, self.patterns).items():
             matcher.add(label, phrases)
 
         return matcher
 
     def __call__(self, doc: Doc) -> Doc:
         entities = []
-        used_tokens = set()
+        used_tokens = UsedTokens(doc)
+
+        if self.matcher is None:
+            self.matcher = self.build_matcher()
 
         matches = self.matcher(doc, as_spans=True)
+        profile.count(self.name, matches=len(matches))
+
         matches = filter_spans(matches)
+        if not matches:
+            return doc
 
         for ent in doc.ents:
             entities.append(ent)
-            used_tokens.update(range(ent.start, ent.end))
+            used_tokens.add(ent)
 
         for ent in matches:
-            texts = []
-
-            ent_tokens = set(range(ent.start, ent.end))
-            if ent_tokens & used_tokens:
+            if used_tokens.overlaps(ent):
                 continue
 
-            for token in ent:
-                text = token.text.lower()
-                texts.append(text)
-
-            used_tokens |= ent_tokens
+            used_tokens.add(ent)
 
             entities.append(ent)
 
@@ -1,4 +1,24 @@
+import re
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
 from spacy.tokens import Doc, Span
+from spacy.vocab import Vocab
+
+from traiter.pipes.reject_match import RejectMatch, SkipTraitCreation
+
+# Boolean token attributes that are cheap to check for with Doc.to_array()
+FLAGS = """
+    IS_ALPHA IS_ASCII IS_DIGIT IS_LOWER IS_UPPER IS_TITLE IS_PUNCT IS_SPACE IS_STOP
+    IS_BRACKET IS_QUOTE IS_LEFT_PUNCT IS_RIGHT_PUNCT IS_CURRENCY
+    LIKE_NUM LIKE_URL LIKE_EMAIL
+    """.split()
+
+LEXEME_FLAG = re.compile(r"^FLAG\d+$")  # Custom flags, like the ones for regexes
+
+BATCH = "_batch"  # A callback's batch version is registered under its name + this
+REJECTED = object()  # The trait for a match that its callback rejected
 
 
 def clear_tokens(ent: Span) -> None:
@@ -13,3 +33,125 @@ def clear_tokens(ent: Span) -> None:
 def intern_string(doc: Doc, string: str) -> None:
     if string not in doc.vocab.strings:
         doc.vocab.strings.add(string)
+
+
+class UsedTokens:
+    """Track which tokens in a doc already belong to an entity, one byte per token."""
+
+    def __init__(self, doc: Doc) -> None:
+        self.used = bytearray(len(doc))
+
+    def overlaps(self, span: Span) -> bool:
+        return self.used.find(1, span.start, span.end) >= 0
+
+    def add(self, span: Span) -> None:
+        self.used[span.start : span.end] = b"\x01" * len(span)
+
+
+class Triggers:
+    """
+    Find docs where none of a pipe's matcher patterns can possibly match.
+
+    Every required token in a pattern, i.e. one that is not optional, that matches on
+    an entity type or a boolean flag must be in the doc for the pattern to match. If
+    each pattern is missing one of these then the pipe can skip the doc. Give it the
+    patterns after flag_regexes() so that regular expressions count as flags too.
+    Patterns with only other attributes can't be checked this way, so pipes with them
+    never skip a doc.
+    """
+
+    def __init__(
+        self, vocab: Vocab, patterns: dict[str, list[list[dict[str, Any]]]]
+    ) -> None:
+        self.vocab = vocab
+        self.needs = [self.pattern_needs(p) for pats in patterns.values() for p in pats]
+        self.always = not all(self.needs)
+        self.attrs = sorted({attr for needs in self.needs for attr, _ in needs})
+        self.columns = {attr: i for i, attr in enumerate(self.attrs)}
+
+    def pattern_needs(self, pattern: list[dict[str, Any]]) -> list[tuple[str, set]]:
+        needs = []
+        for token in pattern:
+            if not self.is_required(token.get("OP")):
+                continue
+
+            for attr, value in token.items():
+                if attr == "ENT_TYPE":
+                    labels = [value] if isinstance(value, str) else value.get("IN")
+                    if labels:
+                        needs.append(
+                            (attr, {self.vocab.strings.add(lb) for lb in labels})
+                        )
+
+                elif self.is_flag(attr) and isinstance(value, bool):
+                    needs.append((attr, {int(value)}))
+
+        return needs
+
+    @staticmethod
+    def is_flag(attr: str) -> bool:
+        return attr in FLAGS or LEXEME_FLAG.match(attr) is not None
+
+    @staticmethod
+    def is_required(op: str | None) -> bool:
+        if op in (None, "+"):
+            return True
+        match = re.match(r"^{(\d+)", op)
+        return bool(match) and int(match.group(1)) > 0
+
+    def may_match(self, doc: Doc) -> bool:
+        if self.always:
+            return True
+
+        array = doc.to_array(self.attrs).reshape(len(doc), len(self.attrs))
+        present = {}  # Only get the values for the attributes that are checked
+
+        for needs in self.needs:
+            for attr, values in needs:
+                if (found := present.get(attr)) is None:
+                    found = present[attr] = set(array[:, self.columns[attr]].tolist())
+                if found.isdisjoint(values):
+                    break
+            else:
+                return True
+
+        return False
+
+
+def dispatch(
+    batch: list[list[Span]],  # The matches in each doc
+    dispatch_table: dict[str, Callable],
+    batch_table: dict[str, Callable],
+) -> list[list[Any]]:
+    """
+    Get the trait for every match in a batch of docs.
+
+    Labels with a batch callback get all of their matches in the batch in one call,
+    and the callback returns a trait for each one, or None to reject it. Any other
+    matches are handed to their callback one at a time in document order. Rejected
+    matches get REJECTED for a trait and matches without a callback get None.
+    """
+    traits = [[None] * len(matches) for matches in batch]
+
+    labels = defaultdict(list)
+    for i, matches in enumerate(batch):
+        for j, match in enumerate(matches):
+            if match.label_ in batch_table:
+                labels[match.label_].append((i, j))
+
+    for label, where in labels.items():
+        spans = [batch[i][j] for i, j in where]
+        for (i, j), trait in zip(where, batch_table[label](spans), strict=True):
+            traits[i][j] = REJECTED if trait is None else trait
+
+    for i, matches in enumerate(batch):
+        for j, match in enumerate(matches):
+            label = match.label_
+            if label in batch_table or not (action := dispatch_table.get(label)):
+                continue
+            try:
+                traits[i][j] = action(match)
+            except (RejectMatch, SkipTraitCreation):
+                traits[i][j] = REJECTED
+
+    return traits
@@ -0,0 +1,172 @@
+"""
+Profile a pipeline's components.
+
+Use it like so:
+
+    with profile.Profiler(nlp) as profiler:
+        for doc in nlp.pipe(texts):
+            ...
+    print(profiler.report())
+    profiler.to_json(path)
+
+The profiler swaps every component for a stand-in that times the work the component
+does. A call is timed around the component's __call__, and a component with a pipe()
+method is timed around each next() on its output, less the time it spent waiting on
+the components before it. Time spent in the tokenizer or by the code consuming the
+docs is not charged to any component. It only profiles the pipeline in this process,
+so use it with nlp.pipe(n_process=1).
+
+Trait pipes also report how many matches they found and how many were rejected by a
+RejectMatch or SkipTraitCreation. They only do this while a profiler is active.
+"""
+
+import json
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from spacy.language import Language
+from spacy.tokens import Doc
+
+PROFILES: dict[str, "Profiler"] = {}  # The active profilers
+
+
+@dataclass
+class Stats:
+    calls: int = 0
+    seconds: float = 0.0
+    matches: int = 0
+    rejected: int = 0
+    ents_in: int = 0
+    ents_out: int = 0
+
+
+class Profiler:
+    def __init__(self, nlp: Language, name: str = "profile") -> None:
+        self.nlp = nlp
+        self.name = name
+        self.stats: dict[str, Stats] = {}
+        self.procs: dict[str, Any] = {}  # The components the stand-ins replaced
+
+    def __enter__(self) -> Self:
+        if self.name in PROFILES:
+            msg = f"Profiler {self.name} is already active"
+            raise ValueError(msg)
+
+        components = self.nlp._components
+        for i, (pipe_name, proc) in enumerate(components):
+            if pipe_name in self.nlp.disabled:
+                continue
+            self.stats[pipe_name] = Stats()
+            self.procs[pipe_name] = proc
+            timed = TimedBatchPipe if hasattr(proc, "pipe") else TimedPipe
+            components[i] = (pipe_name, timed(proc, self.stats[pipe_name]))
+
+        PROFILES[self.name] = self
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        PROFILES.pop(self.name, None)
+        components = self.nlp._components
+        for i, (pipe_name, _) in enumerate(components):
+            if proc := self.procs.get(pipe_name):
+                components[i] = (pipe_name, proc)
+        self.procs = {}
+
+    def count(self, pipe: str, *, matches: int = 0, rejected: int = 0) -> None:
+        if stats := self.stats.get(pipe):
+            stats.matches += matches
+            stats.rejected += rejected
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_seconds": sum(s.seconds for s in self.stats.values()),
+            "pipes": {
+                name: {"factory": self.nlp.get_pipe_meta(name).factory} | asdict(s)
+                for name, s in self.stats.items()
+            },
+        }
+
+    def to_json(self, path: Path) -> None:
+        with Path(path).open("w") as out:
+            json.dump(self.to_dict(), out, indent=2)
+
+    def report(self) -> str:
+        """Format the stats as a table with the slowest pipes first."""
+        total = sum(s.seconds for s in self.stats.values()) or 1.0
+        header = (
+            f"{'pipe':<28} {'ms/doc':>8} {'%':>6} {'matches':>8} {'rejected':>9} "
+            f"{'ents in':>8} {'ents out':>9}"
+        )
+        lines = [header]
+        for name, s in sorted(self.stats.items(), key=lambda kv: -kv[1].seconds):
+            ms = s.seconds * 1000.0 / s.calls if s.calls else 0.0
+            lines.append(
+                f"{name:<28} {ms:>8.3f} {s.seconds * 100.0 / total:>6.1f} "
+                f"{s.matches:>8} {s.rejected:>9} {s.ents_in:>8} {s.ents_out:>9}"
+            )
+        return "\n".join(lines)
+
+
+def count(pipe: str, *, matches: int = 0, rejected: int = 0) -> None:
+    """Record the matches a pipe found in every active profiler."""
+    for profiler in PROFILES.values():
+        profiler.count(pipe, matches=matches, rejected=rejected)
+
+
+class TimedPipe:
+    """Stand in for a component and time its calls."""
+
+    def __init__(self, proc: Any, stats: Stats) -> None:
+        self.proc = proc
+        self.stats = stats
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.proc, attr)
+
+    def __call__(self, doc: Doc, **kwargs: Any) -> Doc:
+        self.stats.ents_in += len(doc.ents)
+        start = time.perf_counter()
+        doc = self.proc(doc, **kwargs)
+        self.stats.seconds += time.perf_counter() - start
+        self.stats.calls += 1
+        self.stats.ents_out += len(doc.ents)
+        return doc
+
+
+class TimedBatchPipe(TimedPipe):
+    """Stand in for a component with a pipe() method and time its batches."""
+
+    def pipe(self, docs: Iterable[Doc], **kwargs: Any) -> Iterator[Doc]:
+        waiting = 0.0  # Time spent getting docs from the components before this one
+
+        def feed() -> Iterator[Doc]:
+            nonlocal waiting
+            docs_in = iter(docs)
+            while True:
+                start = time.perf_counter()
+                doc = next(docs_in, None)
+                waiting += time.perf_counter() - start
+                if doc is None:
+                    return
+                self.stats.ents_in += len(doc.ents)
+                yield doc
+
+        docs_out = self.proc.pipe(feed(), **kwargs)
+        while True:
+            start, waited = time.perf_counter(), waiting
+            doc = next(docs_out, None)
+            self.stats.seconds += time.perf_counter() - start - (waiting - waited)
+            if doc is None:
+                return
+            self.stats.calls += 1
+            self.stats.ents_out += len(doc.ents)
+            yield doc
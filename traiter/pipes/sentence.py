@@ -3,11 +3,25 @@ Break text into sentences.
 
 Experimental: Try using an agreement of both the dependency-based and statistical
 sentence recognizers.
+
+By default, the sentence recognizers come from two separate copies of the base model
+and this pipe goes before the host's parser, which then keeps to the sentences.
+
+With use_host=True, they are the host pipeline's own parser and (disabled) senter
+components. This pipe must then be added after the host's parser. It reads the
+sentences from the parse and only runs the senter, so nothing is parsed twice. spaCy
+won't change the sentences of a parsed doc, so the parse is dropped. None of the rules
+use it.
 """
 
-import spacy
+from collections.abc import Iterable, Iterator
+
+from spacy.attrs import DEP, HEAD
 from spacy.language import Language
 from spacy.tokens import Doc
+from spacy.util import minibatch
+
+from traiter.pylib import models
 
 SENTENCES = "sentences"
 
@@ -15,26 +29,68 @@ SENTENCES = "sentences"
 @Language.factory(SENTENCES)
 class Sentence:
     def __init__(
-        self, nlp: Language, name: str, base_model: str = "en_core_web_md"
+        self,
+        nlp: Language,
+        name: str,
+        base_model: str = "en_core_web_md",
+        *,
+        use_host: bool = False,
     ) -> None:
         self.nlp = nlp
         self.name = name
+        self.use_host = use_host
 
-        self.nlp_d = spacy.load(base_model, exclude=["ner"])
+        if use_host:
+            self.nlp_s = nlp.get_pipe("senter")
 
-        self.nlp_s = spacy.load(base_model, exclude=["parser", "ner"])
-        self.nlp_s.enable_pipe("senter")
+        else:
+            self.nlp_d = models.shared(base_model, exclude=["ner"])
+            self.nlp_s = models.shared(
+                base_model, exclude=["parser", "ner"], enable=["senter"]
+            )
 
     def __call__(self, doc: Doc) -> Doc:
-        doc_d = self.nlp_d(doc.text)
-        doc_s = self.nlp_s(doc.text)
+        if self.use_host:
+            # The host's parser has already run, annotate a copy for the senter
+            doc_d = doc
+            doc_s = self.nlp_s(doc.copy())
+        else:
+            doc_d = self.nlp_d(doc.text)
+            doc_s = self.nlp_s(doc.text)
+
+        self.set_starts(doc, doc_d, doc_s)
+        return doc
 
+    def pipe(self, stream: Iterable[Doc], batch_size: int = 128) -> Iterator[Doc]:
+        """Send whole batches through the sentence recognizers."""
+        for docs in minibatch(stream, size=batch_size):
+            if self.use_host:
+                docs_d = docs
+                docs_s = self.nlp_s.pipe(
+                    [d.copy() for d in docs], batch_size=batch_size
+                )
+            else:
+                texts = [d.text for d in docs]
+                docs_d = self.nlp_d.pipe(texts, batch_size=batch_size)
+                docs_s = self.nlp_s.pipe(texts, batch_size=batch_size)
+
+            for doc, doc_d, doc_s in zip(docs, docs_d, docs_s, strict=True):
+                self.set_starts(doc, doc_d, doc_s)
+                yield doc
+
+    @staticmethod
+    def set_starts(doc: Doc, doc_d: Doc, doc_s: Doc) -> None:
+        """Keep the sentence starts that both recognizers agree on."""
         starts_d = {s.start for s in doc_d.sents}
         starts_s = {s.start for s in doc_s.sents}
 
         agree = starts_d & starts_s
 
+        if doc.has_annotation("DEP"):
+            # Drop the host's parse so the sentence starts can be changed
+            parse = doc.to_array([HEAD, DEP])
+            parse[:] = 0
+            doc.from_array([HEAD, DEP], parse)
+
         for i in range(len(doc)):
             doc[i].is_sent_start = i in agree
-
-        return doc
@@ -8,6 +8,7 @@ complications for rule-based parsers.
 import csv
 import re
 import string
+from functools import cache
 from pathlib import Path
 
 from spacy.lang.char_classes import ALPHA, LIST_HYPHENS, LIST_PUNCT, LIST_QUOTES
@@ -41,29 +42,43 @@ ABBREVS += [f"{c}." for c in string.ascii_uppercase]
 
 
 def append_prefix_regex(nlp: Language, prefixes: list[str] | None = None) -> None:
-    prefixes = prefixes or []
-    prefixes += nlp.Defaults.prefixes
-    prefix_re = compile_prefix_regex(prefixes)
-    nlp.tokenizer.prefix_search = prefix_re.search
+    prefixes = (*(prefixes or []), *nlp.Defaults.prefixes)
+    nlp.tokenizer.prefix_search = prefix_regex(prefixes).search
 
 
 def append_suffix_regex(nlp: Language, suffixes: list[str] | None = None) -> None:
-    suffixes = suffixes or []
-    suffixes += nlp.Defaults.suffixes
-    suffix_re = compile_suffix_regex(suffixes)
-    nlp.tokenizer.suffix_search = suffix_re.search
+    suffixes = (*(suffixes or []), *nlp.Defaults.suffixes)
+    nlp.tokenizer.suffix_search = suffix_regex(suffixes).search
 
 
 def append_infix_regex(nlp: Language, infixes: list[str] | None = None) -> None:
-    infixes = infixes or []
-    infixes += nlp.Defaults.infixes
-    infix_re = compile_infix_regex(infixes)
-    nlp.tokenizer.infix_finditer = infix_re.finditer
+    infixes = (*(infixes or []), *nlp.Defaults.infixes)
+    nlp.tokenizer.infix_finditer = infix_regex(infixes).finditer
+
+
+# The regexes are big alternations that are slow to compile, so they are compiled
+# once per process and shared by every pipeline with the same rules
+
+
+@cache
+def prefix_regex(prefixes: tuple[str, ...]) -> re.Pattern:
+    return compile_prefix_regex(prefixes)
+
+
+@cache
+def suffix_regex(suffixes: tuple[str, ...]) -> re.Pattern:
+    return compile_suffix_regex(suffixes)
+
+
+@cache
+def infix_regex(infixes: tuple[str, ...]) -> re.Pattern:
+    return compile_infix_regex(infixes)
 
 
 def append_abbrevs(nlp: Language, abbrevs: list[str]) -> None:
-    for abbrev in abbrevs:
-        nlp.tokenizer.add_special_case(abbrev, [{"ORTH": abbrev}])
+    rules = dict(nlp.tokenizer.rules)
+    rules |= {a: [{"ORTH": a}] for a in abbrevs}
+    nlp.tokenizer.rules = rules
 
 
 def remove_special_case(nlp: Language, remove: list[str]) -> None:
@@ -71,11 +86,21 @@ def remove_special_case(nlp: Language, remove: list[str]) -> None:
     Remove special rules from the tokenizer.
 
     This is a workaround for when these special cases interfere with matcher rules.
+    The remaining special cases are all installed at once.
     """
-    specials = (r for r in nlp.tokenizer.rules if r not in remove)
-    nlp.tokenizer.rules = None
-    for text in specials:
-        nlp.tokenizer.add_special_case(text, [{"ORTH": text}])
+    nlp.tokenizer.rules = special_cases(nlp.tokenizer.rules, remove=remove)
+
+
+def special_cases(
+    rules: dict[str, list[dict]],
+    *,
+    add: list[str] | None = None,
+    remove: list[str] | None = None,
+) -> dict[str, list[dict]]:
+    """Build a special case table where every special case is a single token."""
+    remove = set(remove or [])
+    texts = [*rules, *(add or [])]
+    return {t: [{"ORTH": t}] for t in texts if t not in remove}
 
 
 def get_states() -> set[str]:
@@ -86,18 +111,28 @@ def get_states() -> set[str]:
 
 
 def setup_tokenizer(nlp: Language) -> None:
+    """
+    Set up the tokenizer for rule-based parsing.
+
+    Every change to the tokenizer's regexes reloads all of its special cases, so the
+    final special case table is worked out first and installed once at the end.
+    """
+    rules = nlp.tokenizer.rules
+    nlp.tokenizer.rules = {}
+
     append_prefix_regex(nlp, PREFIX)
     append_infix_regex(nlp, INFIX)
     append_suffix_regex(nlp, SUFFIX)
-    append_abbrevs(nlp, ABBREVS)
+
     # Remove patterns that interfere with parses
     states = get_states()
     removes = []
-    for rule in nlp.tokenizer.rules:
+    for rule in [*rules, *ABBREVS]:
         if re.search(r"\d", rule):
             removes.append(rule)
         if rule.lower() in states:
             removes.append(rule)
         if rule in ("'s", "'S"):
             removes.append(rule)
-    remove_special_case(nlp, removes)
+
+    nlp.tokenizer.rules = special_cases(rules, add=ABBREVS, remove=removes)
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 from spacy import util
@@ -6,7 +6,9 @@ from spacy.language import Language
 from spacy.matcher import Matcher
 from spacy.tokens import Doc, Span
 
-from traiter.pipes.reject_match import RejectMatch, SkipTraitCreation
+from traiter.pipes import pipe_util, profile
+from traiter.pipes.pipe_util import Triggers, UsedTokens
+from traiter.pylib.pattern_compiler import flag_regexes
 
 ADD_TRAITS = "add_traits"
 
@@ -30,7 +32,10 @@ class AddTraits:
         self.overwrite = overwrite or []
 
         self.dispatch_table = self.build_dispatch_table()
+        self.batch_table = self.build_batch_table()
+        self.flagged = self.flag_patterns()
         self.matcher = self.build_matcher()
+        self.triggers = Triggers(self.nlp.vocab, self.flagged)
 
     def build_dispatch_table(self) -> dict[str, Callable]:
         dispatch_table = {}
@@ -40,83 +45,113 @@ class AddTraits:
                     dispatch_table[label] = func
         return dispatch_table
 
+    def build_batch_table(self) -> dict[str, Callable]:
+        batch_table = {}
+        if self.dispatch:
+            for label, registered in self.dispatch.items():
+                if (batched := registered + pipe_util.BATCH) in util.registry.misc:
+                    batch_table[label] = util.registry.misc.get(batched)
+        return batch_table
+
+    def flag_patterns(self) -> dict[str, list[list[dict[str, Any]]]]:
+        return {
+            label: flag_regexes(self.nlp.vocab, label, patterns)
+            for label, patterns in self.patterns.items()
+        }
+
     def build_matcher(self) -> Matcher:
-        matcher = Matcher(self.nlp.vocab)
+        matcher = Matcher(self.nlp.vocab, validate=False)  # Validated when flagged
         # Can't be greedy if we are keeping traits in the middle of a match
         greedy = None if self.keep else "LONGEST"
-        for label, patterns in self.patterns.items():
+        for label, patterns in self.flagged.items():
             matcher.add(label, patterns, greedy=greedy)
         return matcher
 
     def __call__(self, doc: Doc) -> Doc:
-        matches = self.matcher(doc, as_spans=True)
+        self.add_traits([doc])
+        return doc
+
+    def pipe(self, stream: Iterable[Doc], batch_size: int = 128) -> Iterator[Doc]:
+        for docs in util.minibatch(stream, size=batch_size):
+            self.add_traits(docs)
+            yield from docs
 
-        entities, used_tokens = self.filter_entities(doc)
+    def add_traits(self, docs: list[Doc]) -> None:
+        batch = []
+        for doc in docs:
+            if not self.triggers.may_match(doc):
+                continue
 
-        matches = self.remove_overlapping_matches(matches, used_tokens)
-        matches = util.filter_spans(matches)
+            matches = self.matcher(doc, as_spans=True)
+            found = len(matches)
 
-        for ent in matches:
-            label = ent.label_
+            entities, used_tokens = self.filter_entities(doc)
 
-            ent_tokens = set(range(ent.start, ent.end))
-            if ent_tokens & used_tokens:
-                continue
+            matches = self.remove_overlapping_matches(matches, used_tokens)
+            matches = util.filter_spans(matches)
 
-            trait = None
-            if action := self.dispatch_table.get(label):
-                try:
-                    trait = action(ent)
-                except (RejectMatch, SkipTraitCreation):
+            # The matches no longer overlap each other or the entities we kept so
+            # their traits can be made independently, and in batches
+            batch.append((doc, found, entities, used_tokens, matches))
+
+        traits = pipe_util.dispatch(
+            [b[-1] for b in batch], self.dispatch_table, self.batch_table
+        )
+
+        for (doc, found, entities, used_tokens, matches), doc_traits in zip(
+            batch, traits, strict=True
+        ):
+            rejected = 0
+
+            for ent, trait in zip(matches, doc_traits, strict=True):
+                label = ent.label_
+
+                if trait is pipe_util.REJECTED:
+                    rejected += 1
                     continue
 
-            # Create a new trait
-            used_tokens |= ent_tokens
+                # Create a new trait
+                used_tokens.add(ent)
 
-            ent._.trait = trait
-            self.relabel_ent(ent, label)
-            entities.append(ent)
+                ent._.trait = trait
+                self.relabel_ent(ent, label)
+                entities.append(ent)
 
-        self.add_untouched_entities(doc, entities, used_tokens)
+            self.add_untouched_entities(doc, entities, used_tokens)
+            profile.count(self.name, matches=found, rejected=rejected)
 
-        doc.set_ents(sorted(entities, key=lambda e: e.start))
-        return doc
+            doc.set_ents(sorted(entities, key=lambda e: e.start))
 
     @staticmethod
     def add_untouched_entities(
         doc: Doc,
         entities: list[Span],
-        used_tokens: set[int],
+        used_tokens: UsedTokens,
     ) -> None:
         """Add entities that do not overlap with any of the matches."""
-        for ent in doc.ents:
-            ent_tokens = set(range(ent.start, ent.end))
-            if not ent_tokens & used_tokens:
-                entities.append(ent)
+        entities.extend(e for e in doc.ents if not used_tokens.overlaps(e))
 
     @staticmethod
     def remove_overlapping_matches(
         matches: list[Span],
-        used_tokens: set[int],
+        used_tokens: UsedTokens,
     ) -> list[Span]:
         """Remove any matches that overlap with an entity we kept."""
         filtered_matches = []
         for match in matches:
-            ent_tokens = set(range(match.start, match.end))
-            if ent_tokens & used_tokens:
+            if used_tokens.overlaps(match):
                 continue
             filtered_matches.append(match)
         return filtered_matches
 
-    def filter_entities(self, doc: Doc) -> tuple[list[Span], set[Any]]:
-        used_tokens: set[Any] = set()
+    def filter_entities(self, doc: Doc) -> tuple[list[Span], UsedTokens]:
+        used_tokens = UsedTokens(doc)
         entities = []
         for ent in doc.ents:
             if ent.label_ in self.overwrite or ent.label_ not in self.keep:
                 continue
             if ent.label_ in self.keep:
-                ent_tokens = set(range(ent.start, ent.end))
-                used_tokens |= ent_tokens
+                used_tokens.add(ent)
                 entities.append(ent)
         return entities, used_tokens
 
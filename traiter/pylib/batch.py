@@ -0,0 +1,136 @@
+"""
+Extract traits from many texts.
+
+    for id_, traits in batch.extract(records, n_process=8):
+        ...
+
+Records are (id, text) pairs and the traits come back as dicts in the same order as
+the records. With more than one process each worker builds its own pipeline, so the
+rule callbacks and the custom extensions are registered in the workers too, and only
+the trait dicts are sent back. Pass a cached builder, like
+functools.partial(pipeline.build, cache_dir), to make starting the workers quicker.
+
+Pass a ResultCache to skip the pipeline for texts that have been seen before.
+"""
+
+import multiprocessing
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Any
+
+from spacy.language import Language
+from spacy.tokens import Doc
+from spacy.util import minibatch
+
+from traiter.pylib import pipeline, util
+from traiter.pylib.result_cache import ResultCache
+from traiter.rules.base_rule import BaseRule
+
+Record = tuple[Hashable, str]
+Result = tuple[Hashable, list[dict[str, Any]]]
+
+# The pipeline, text cleaner, and batch size in a worker process
+WORKER: dict[str, Any] = {}
+
+
+def extract(
+    records: Iterable[Record],
+    *,
+    builder: Callable[[], Language] = pipeline.build,
+    clean: Callable[[str], str] | None = util.clean_text,
+    batch_size: int = 128,
+    n_process: int = 1,
+    cache: ResultCache | None = None,
+) -> Iterator[Result]:
+    """Yield the traits for each record in the order the records were given."""
+    batches = minibatch(records, size=batch_size)
+
+    if cache is None:
+        for results in run_batches(batches, builder, clean, batch_size, n_process):
+            yield from results
+        return
+
+    # Only the cache misses go through the pipeline, so clean the text up front
+    pending = deque()
+
+    def misses() -> Iterator[list[Record]]:
+        for batch in batches:
+            texts = [clean(r[1]) if clean else r[1] for r in batch]
+            found = {t: cache.get(t) for t in texts}
+            pending.append((batch, texts, found))
+            yield [(t, t) for t, traits in found.items() if traits is None]
+
+    for results in run_batches(misses(), builder, None, batch_size, n_process):
+        batch, texts, found = pending.popleft()
+        for text, traits in results:
+            found[text] = traits
+            cache.put(text, traits)
+        cache.commit()
+        yield from ((r[0], found[t]) for r, t in zip(batch, texts, strict=True))
+
+
+def run_batches(
+    batches: Iterable[list[Record]],
+    builder: Callable[[], Language],
+    clean: Callable[[str], str] | None,
+    batch_size: int,
+    n_process: int,
+) -> Iterator[list[Result]]:
+    """Yield the results for each batch in order."""
+    if n_process <= 1:
+        nlp = None  # Not built until needed, all records may be in the cache
+        for batch in batches:
+            if batch and nlp is None:
+                nlp = builder()
+            yield extract_batch(nlp, batch, clean, batch_size) if batch else []
+        return
+
+    with multiprocessing.Pool(
+        n_process,
+        initializer=init_worker,
+        initargs=(builder, clean, batch_size),
+    ) as pool:
+        # Only a few batches are in flight at a time so memory use stays flat
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.apply_async(worker_batch, (batch,)))
+            if len(pending) >= n_process * 2:
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
+
+
+def extract_batch(
+    nlp: Language,
+    batch: list[Record],
+    clean: Callable[[str], str] | None,
+    batch_size: int,
+) -> list[Result]:
+    ids = [r[0] for r in batch]
+    texts = [clean(r[1]) if clean else r[1] for r in batch]
+    docs = nlp.pipe(texts, batch_size=batch_size)
+    return [(id_, doc_traits(doc)) for id_, doc in zip(ids, docs, strict=True)]
+
+
+def doc_traits(doc: Doc) -> list[dict[str, Any]]:
+    return [trait_dict(e._.trait) for e in doc.ents if e._.trait]
+
+
+def trait_dict(trait: BaseRule) -> dict[str, Any]:
+    """Convert a trait to a dict that says what kind of trait it is."""
+    return {"trait": trait._trait} | trait.to_dict()
+
+
+def init_worker(
+    builder: Callable[[], Language],
+    clean: Callable[[str], str] | None,
+    batch_size: int,
+) -> None:
+    WORKER["nlp"] = builder()
+    WORKER["clean"] = clean
+    WORKER["batch_size"] = batch_size
+
+
+def worker_batch(batch: list[Record]) -> list[Result]:
+    return extract_batch(WORKER["nlp"], batch, WORKER["clean"], WORKER["batch_size"])
@@ -2,6 +2,7 @@ import csv
 from collections import defaultdict
 from collections.abc import Generator
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -13,12 +14,15 @@ DC = "dc:"
 SEP = " | "
 FIELD_SEP = " ~ "
 
+TERMS = Path(__file__).parent.parent / "rules" / "terms"
+DWC_CSV = TERMS / "dwc_terms.csv"
+NAMES_CSV = TERMS / "dwc_names.csv"  # Just the namespaced names from DWC_CSV
+
 
 def read_dwc_terms() -> tuple[dict, dict]:
     core, dublin = {}, {}
 
-    path = Path(__file__).parent.parent / "rules" / "terms" / "dwc_terms.csv"
-    with path.open(encoding="utf8") as f:
+    with DWC_CSV.open(encoding="utf8") as f:
         for row in csv.DictReader(f):
             name = row["term_localName"]
             name = name[0].lower() + name[1:]
@@ -35,7 +39,36 @@ def read_dwc_terms() -> tuple[dict, dict]:
     return core, dublin
 
 
-CORE, DUBLIN = read_dwc_terms()
+@cache
+def dwc_terms() -> tuple[dict, dict]:
+    """Get the full term table. It is big so it is only read when needed."""
+    return read_dwc_terms()
+
+
+@cache
+def dwc_names() -> frozenset[str]:
+    """Get the namespaced term names without reading the full term table."""
+    with NAMES_CSV.open(encoding="utf8") as f:
+        return frozenset(row["name"] for row in csv.DictReader(f))
+
+
+def write_dwc_names() -> None:
+    """Rebuild the names file after updating the full term table."""
+    core, _ = read_dwc_terms()
+    with NAMES_CSV.open("w", encoding="utf8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name"])
+        writer.writerows([n] for n in sorted(core))
+
+
+def __getattr__(name: str) -> dict:
+    # CORE and DUBLIN are built on first use
+    if name == "CORE":
+        return dwc_terms()[0]
+    if name == "DUBLIN":
+        return dwc_terms()[1]
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 @dataclass
@@ -115,7 +148,7 @@ class DarwinCore:
 
     @staticmethod
     def ns(name: str) -> str:
-        namespace = DC if name in DUBLIN else DWC
+        namespace = DC if name.startswith(DC) and name in dwc_names() else DWC
         return name if name.startswith(namespace) else namespace + name
 
     @staticmethod
@@ -0,0 +1,86 @@
+"""
+Share loaded spaCy models across a process.
+
+Every model loaded through here with the same name shares one vocabulary, and with
+it one copy of the word vectors. Use shared() for models that are only ever used to
+annotate docs, like the sentence recognizers, and fresh() for models that will be
+modified, like a traiter pipeline that gets its own tokenizer and pipes.
+
+A name like "blank:en" gets a blank model, just a tokenizer and a vocabulary without
+vectors, for the language.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+import spacy
+from spacy.language import Language
+from spacy.util import get_lang_class
+from spacy.vocab import Vocab, create_vocab
+
+BLANK = "blank:"
+
+MODELS: dict[tuple[str, frozenset[str], frozenset[str]], Language] = {}
+VOCABS: dict[str, Vocab] = {}
+
+
+def shared(
+    name: str,
+    *,
+    exclude: Iterable[str] = (),
+    enable: Iterable[str] = (),
+) -> Language:
+    """
+    Get a process-wide copy of a model.
+
+    The enable argument turns on components that are disabled by default, like the
+    senter. Do not add pipes to, or otherwise modify, the returned model.
+    """
+    key = (name, frozenset(exclude), frozenset(enable))
+    if key not in MODELS:
+        nlp = fresh(name, exclude=exclude)
+        for pipe_name in enable:
+            nlp.enable_pipe(pipe_name)
+        MODELS[key] = nlp
+    return MODELS[key]
+
+
+def fresh(name: str, *, exclude: Iterable[str] = ()) -> Language:
+    """Load a new copy of a model that shares its vocabulary with all other copies."""
+    exclude = list(exclude)
+
+    if name.startswith(BLANK):
+        nlp = spacy.blank(name.removeprefix(BLANK), vocab=VOCABS.get(name, True))
+        VOCABS.setdefault(name, nlp.vocab)
+        return nlp
+
+    if name not in VOCABS:
+        nlp = spacy.load(name, exclude=exclude)
+        VOCABS[name] = nlp.vocab
+        return nlp
+
+    # The vocab is already loaded so don't read it, or the vectors, from disk again
+    return spacy.load(name, vocab=VOCABS[name], exclude=[*exclude, "vocab"])
+
+
+def vocab(name: str, *, path: Path | None = None, lang: str = "en") -> Vocab:
+    """
+    Get the vocabulary shared by every copy of a model.
+
+    If it is not loaded yet, it is read from the path, which is a saved copy of the
+    vocabulary, or else from the model itself.
+    """
+    if name not in VOCABS:
+        lang = name.removeprefix(BLANK) if name.startswith(BLANK) else lang
+        if path:
+            VOCABS[name] = create_vocab(lang, get_lang_class(lang).Defaults)
+            VOCABS[name].from_disk(path)
+        else:
+            fresh(name)
+    return VOCABS[name]
+
+
+def clear() -> None:
+    """Drop all cached models so they can be garbage collected."""
+    MODELS.clear()
+    VOCABS.clear()
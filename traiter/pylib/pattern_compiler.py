@@ -8,8 +8,17 @@ some simple rules.
 
 import copy
 import re
+from typing import Any
 from warnings import warn
 
+from spacy.errors import MatchPatternError
+from spacy.schemas import validate_token_pattern
+from spacy.vocab import Vocab
+
+# The range of lexeme flags spaCy leaves for custom use
+FIRST_FLAG = 19
+LAST_FLAG = 63
+
 
 class CompilerAccumulator:
     def __init__(self) -> None:
@@ -79,3 +88,71 @@ class Compiler:
             self.patterns.append(pattern_seq)
 
         return self
+
+
+class RegexFlag:
+    """A lexeme flag for a regular expression on a token's text or lower case text."""
+
+    def __init__(self, attr: str, regex: str) -> None:
+        self.attr = attr
+        self.key = (attr, regex)
+        self.compiled = re.compile(regex)
+
+    def __call__(self, text: str) -> bool:
+        text = text.lower() if self.attr == "LOWER" else text
+        return self.compiled.search(text) is not None
+
+
+def regex_flag(vocab: Vocab, attr: str, regex: str) -> str | None:
+    """
+    Get the name of the lexeme flag for a regex, adding it to the vocab if needed.
+
+    spaCy only has a limited number of custom flags, so return None when there are no
+    more flags left. The caller must then keep the regex.
+    """
+    free = None
+    for flag_id in range(FIRST_FLAG, LAST_FLAG + 1):
+        getter = vocab.lex_attr_getters.get(flag_id)
+        if getter is None:
+            free = free or flag_id
+        elif isinstance(getter, RegexFlag) and getter.key == (attr, regex):
+            return f"FLAG{flag_id}"
+
+    if free is None:
+        return None
+
+    vocab.add_flag(RegexFlag(attr, regex), flag_id=free)
+    return f"FLAG{free}"
+
+
+def flag_regexes(
+    vocab: Vocab, label: str, patterns: list[list[dict[str, Any]]]
+) -> list[list[dict[str, Any]]]:
+    """
+    Replace regex token predicates with lexeme flags.
+
+    The matcher runs a regex predicate for every token it checks. A flag is computed
+    once for every word in the vocabulary and then the matcher just checks a bit.
+    The flags are stored in the vocab so all pipes & pipelines that share it will
+    share the flags too. Use the returned patterns with a matcher that doesn't
+    validate patterns, they are validated here before the flags are added.
+    """
+    errors = {i: e for i, p in enumerate(patterns) if (e := validate_token_pattern(p))}
+    if errors:
+        raise MatchPatternError(label, errors)
+
+    flagged = []
+    for pattern in patterns:
+        new_pattern = []
+        for token in pattern:
+            token = copy.copy(token)
+            for attr in ("TEXT", "LOWER"):
+                value = token.get(attr)
+                if not isinstance(value, dict) or list(value.keys()) != ["REGEX"]:
+                    continue
+                if flag := regex_flag(vocab, attr, value["REGEX"]):
+                    del token[attr]
+                    token[flag] = True
+            new_pattern.append(token)
+        flagged.append(new_pattern)
+    return flagged
@@ -1,7 +1,15 @@
+import hashlib
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
 import spacy
 from spacy.language import Language
 
-from traiter.pipes import extensions, sentence, tokenizer
+import traiter
+from traiter.pipes import extensions, phrase, sentence, tokenizer
+from traiter.pylib import models
 from traiter.rules.color import Color
 from traiter.rules.date_ import Date
 from traiter.rules.elevation import Elevation
@@ -14,35 +22,217 @@ from traiter.rules.uuid import Uuid
 
 # from traiter.pipes import debug
 
+BASE_MODEL = "en_core_web_md"
+
+# A blank English tokenizer and nothing else. The rules still work but without a
+# tagger or parser there are no parts of speech or sentences.
+RULES_ONLY = f"{models.BLANK}en"
+
+# No rule uses these components from the base model
+UNUSED = ["ner", "lemmatizer"]
+
+# The rules in the order they are added to the pipeline
+RULES = {
+    "color": Color,
+    "uuid": Uuid,
+    "date": Date,
+    "elevation": Elevation,
+    "lat_long": LatLong,
+    "habitat": Habitat,
+    "trs": TRS,
+    "utm": UTM,
+}
+
+# Rules that must run before a rule. They either make traits that the rule
+# overwrites or claim tokens that the rule would otherwise misread, like the digits
+# at the end of a UUID being read as part of a date.
+PREREQUISITES = {
+    "date": ["uuid"],
+    "elevation": ["uuid"],
+    "lat_long": ["date", "elevation"],
+    "trs": ["date", "lat_long"],
+    "utm": ["trs"],
+}
+
+# Rules with patterns that use parts of speech
+POS_RULES = {"color"}
+
+
+def build(
+    cache_dir: Path | None = None,
+    *,
+    base_model: str = BASE_MODEL,
+    rules: Iterable[str] | None = None,
+    sentences: bool | None = None,
+    host_sentences: bool = False,
+) -> Language:
+    """
+    Build the pipeline on top of a base model.
+
+    Only the given rules, and the rules they need, are added. The default is all of
+    them. The traits are the same as the full pipeline's except where a rule that was
+    left out would have overwritten them, like TRS does to some lat/longs. The
+    sentences are only added for the full pipeline unless asked for, and the base
+    model's tagger and parser are left out when nothing uses them. With
+    host_sentences the sentences come from the pipeline's own parser and senter
+    instead of two more copies of the base model.
+
+    The rules need the base model's tagger for parts of speech and its parser for the
+    sentences, so any trained English model will do. With RULES_ONLY the sentences are
+    skipped and patterns that use parts of speech do not match.
+    """
+    names = rule_names(rules)
+    sentences = rules is None if sentences is None else sentences
+
+    if cache_dir:
+        name = "build"
+        if sentences:
+            name += "_host_sentences" if host_sentences else "_sentences"
+        return cached(
+            cache_dir,
+            "_".join([name, *names]),
+            lambda: build(
+                base_model=base_model,
+                rules=names,
+                sentences=sentences,
+                host_sentences=host_sentences,
+            ),
+            base_model=base_model,
+        )
 
-def build() -> Language:
     extensions.add_extensions()
 
-    nlp = spacy.load("en_core_web_md", exclude=["ner"])
+    exclude = list(UNUSED)
+    if not sentences:
+        exclude += ["parser", "senter"]
+    if not POS_RULES & set(names):
+        exclude += ["tagger", "attribute_ruler"]
+        if not sentences:
+            exclude += ["tok2vec"]
+
+    nlp = models.fresh(base_model, exclude=exclude)
 
     tokenizer.setup_tokenizer(nlp)
 
-    nlp.add_pipe(sentence.SENTENCES, before="parser")
+    if sentences and "parser" in nlp.pipe_names:
+        add_sentences(nlp, base_model=base_model, host_sentences=host_sentences)
+
+    for name in names:
+        RULES[name].pipe(nlp)
 
-    Color.pipe(nlp)
-    Uuid.pipe(nlp)
-    Date.pipe(nlp)
-    Elevation.pipe(nlp)
-    LatLong.pipe(nlp)
-    Habitat.pipe(nlp)
-    TRS.pipe(nlp)
-    UTM.pipe(nlp)
+    phrase.build_matchers(nlp)
 
     return nlp
 
 
-def numerical() -> Language:
+def add_sentences(nlp: Language, *, base_model: str, host_sentences: bool) -> None:
+    if host_sentences:
+        config = {"use_host": True}
+        nlp.add_pipe(sentence.SENTENCES, after="parser", config=config)
+    else:
+        config = {"base_model": base_model}
+        nlp.add_pipe(sentence.SENTENCES, before="parser", config=config)
+
+
+def rule_names(rules: Iterable[str] | None = None) -> list[str]:
+    """Add the prerequisites to the rules and put them in pipeline order."""
+    if rules is None:
+        return list(RULES)
+
+    wanted = set()
+    stack = list(rules)
+    while stack:
+        name = stack.pop()
+        if name not in RULES:
+            msg = f"Unknown rule: {name}. Choose from: {', '.join(RULES)}"
+            raise ValueError(msg)
+        if name not in wanted:
+            wanted.add(name)
+            stack += PREREQUISITES.get(name, [])
+
+    return [n for n in RULES if n in wanted]
+
+
+def numerical(
+    cache_dir: Path | None = None,
+    *,
+    base_model: str = RULES_ONLY,
+) -> Language:
+    """Build a pipeline for numbers. It only needs a tokenizer."""
+    if cache_dir:
+        return cached(
+            cache_dir,
+            "numerical",
+            lambda: numerical(base_model=base_model),
+            base_model=base_model,
+        )
+
     extensions.add_extensions()
 
-    nlp = spacy.load("en_core_web_md", exclude=["ner"])
+    nlp = models.fresh(base_model, exclude=UNUSED)
 
     tokenizer.setup_tokenizer(nlp)
 
     Number.pipe(nlp)
 
+    phrase.build_matchers(nlp)
+
+    return nlp
+
+
+def cached(
+    cache_dir: Path,
+    name: str,
+    builder: Callable[[], Language],
+    *,
+    base_model: str = BASE_MODEL,
+) -> Language:
+    """
+    Load a prebuilt pipeline from the cache directory, building it if needed.
+
+    The tokenizer and every pipe's config, including the compiled patterns, are
+    restored from disk. The phrase matchers are built once the saved tokenizer is
+    back. The saved vocabulary is only read if no other copy of the base model is
+    loaded, otherwise that copy's vocabulary is shared.
+
+    Several processes may build the same pipeline at once. Each one saves it to its
+    own temporary directory and the first to finish wins.
+    """
+    path = Path(cache_dir) / f"{name}_{fingerprint(base_model)}"
+
+    if not path.exists():
+        nlp = builder()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = Path(tempfile.mkdtemp(prefix=f"{path.name}.", dir=path.parent))
+        try:
+            nlp.to_disk(temp)
+            temp.replace(path)
+        except OSError:
+            # Another process saved the same pipeline first
+            if not path.exists():
+                raise
+        finally:
+            shutil.rmtree(temp, ignore_errors=True)
+        return nlp
+
+    extensions.add_extensions()
+    vocab = models.vocab(base_model, path=path / "vocab")
+    nlp = spacy.load(path, vocab=vocab, exclude=["vocab"])
+    phrase.build_matchers(nlp)
     return nlp
+
+
+def fingerprint(base_model: str = BASE_MODEL) -> str:
+    """Hash everything that goes into a pipeline so stale caches are not used."""
+    hasher = hashlib.sha256()
+    hasher.update(spacy.__version__.encode())
+    hasher.update(base_model.encode())
+    hasher.update(str(spacy.util.get_package_version(base_model)).encode())
+
+    root = Path(traiter.__file__).parent
+    for path in sorted(root.glob("**/*")):
+        if path.suffix in (".py", ".csv", ".zip"):
+            hasher.update(str(path.relative_to(root)).encode())
+            hasher.update(path.read_bytes())
+
+    return hasher.hexdigest()[:16]
@@ -0,0 +1,63 @@
+"""
+Replace many strings in one pass.
+
+    replace = replacer.compile_replacements({"teh": "the", "t he": "the"})
+    text = replace(text)
+
+The old strings are put into a trie and the trie is written out as a regex, so
+finding them takes one scan of the text no matter how many there are. Where more
+than one old string matches at the same place the longest one wins, and replaced text
+is never replaced again.
+
+This uses the standard library's re because it is much faster than the regex
+package on these patterns.
+"""
+
+import re
+from collections.abc import Callable
+from functools import lru_cache
+
+
+def compile_replacements(replace: dict[str, str]) -> Callable[[str], str]:
+    """Get a function that does all of the replacements."""
+    return compiled(tuple(replace.items()))
+
+
+@lru_cache(maxsize=32)
+def compiled(items: tuple[tuple[str, str], ...]) -> Callable[[str], str]:
+    replace = {old: new for old, new in items if old}
+    if not replace:
+        return str
+
+    pattern = re.compile(trie_regex(replace))
+
+    def replace_all(text: str) -> str:
+        return pattern.sub(lambda m: replace[m[0]], text)
+
+    return replace_all
+
+
+def trie_regex(words: list[str]) -> str:
+    """Write a regex that matches the longest of the words."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # The end of a word
+
+    return node_regex(trie)
+
+
+def node_regex(node: dict) -> str:
+    alts = [re.escape(c) + node_regex(child) for c, child in sorted(node.items()) if c]
+    if not alts:
+        return ""
+
+    regex = alts[0] if len(alts) == 1 else f"(?:{'|'.join(alts)})"
+
+    if "" in node:
+        # A word ends here but try the longer words first
+        regex = f"(?:{regex})?"
+
+    return regex
@@ -0,0 +1,129 @@
+"""
+Cache extracted traits by the text they came from.
+
+Label datasets have a lot of exact duplicates, like the same locality printed on
+hundreds of sheets, and there is no need to parse them more than once. The cache is
+keyed by a hash of the cleaned text, the builder's config, and the fingerprint of the
+code and base model the pipeline is built from, so a change to any of them never
+returns stale traits. The builder's config is its name and the keyword arguments it
+was given or defaults to, like the base model and rules. The builder should be a
+function or a functools.partial of one, arguments hidden in a lambda are not seen.
+Recently used results are kept in memory and, optionally, every result is also saved
+to an SQLite file.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from spacy.language import Language
+
+from traiter.pylib import pipeline
+
+
+class ResultCache:
+    def __init__(
+        self,
+        builder: Callable[..., Language] = pipeline.build,
+        path: Path | None = None,
+        max_size: int = 100_000,  # Entries in the memory tier
+    ) -> None:
+        config = builder_config(builder)
+        base_model = config.get("base_model", pipeline.BASE_MODEL)
+        config["fingerprint"] = pipeline.fingerprint(base_model)
+        self.namespace = (json.dumps(config, sort_keys=True) + "\0").encode()
+        self.max_size = max_size
+        self.memory: OrderedDict[bytes, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        self.db = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self.db = sqlite3.connect(path)
+            self.db.execute(
+                "create table if not exists results (key blob primary key, traits text)"
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def key(self, text: str) -> bytes:
+        return hashlib.sha256(self.namespace + text.encode()).digest()
+
+    def get(self, text: str) -> list[dict[str, Any]] | None:
+        key = self.key(text)
+
+        traits = self.memory.get(key)
+        if traits is not None:
+            self.memory.move_to_end(key)
+
+        elif self.db:
+            row = self.db.execute(
+                "select traits from results where key = ?", (key,)
+            ).fetchone()
+            if row:
+                traits = row[0]
+                self.remember(key, traits)
+
+        if traits is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(traits)
+
+    def put(self, text: str, traits: list[dict[str, Any]]) -> None:
+        key = self.key(text)
+        traits = json.dumps(traits)
+        self.remember(key, traits)
+        if self.db:
+            self.db.execute(
+                "insert or replace into results (key, traits) values (?, ?)",
+                (key, traits),
+            )
+
+    def remember(self, key: bytes, traits: str) -> None:
+        self.memory[key] = traits
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.max_size:
+            self.memory.popitem(last=False)
+
+    def commit(self) -> None:
+        if self.db:
+            self.db.commit()
+
+    def close(self) -> None:
+        if self.db:
+            self.db.commit()
+            self.db.close()
+            self.db = None
+
+
+def builder_config(builder: Callable[..., Language]) -> dict[str, Any]:
+    """Get the builder's name and the keyword arguments it will build with."""
+    func = builder
+    while isinstance(func, functools.partial):
+        func = func.func
+
+    config = {"builder": f"{func.__module__}.{func.__qualname__}"}
+    for name, param in inspect.signature(builder).parameters.items():
+        # Where the pipeline is cached does not change the traits
+        if name != "cache_dir" and param.default is not param.empty:
+            config[name] = param.default
+    return config
@@ -0,0 +1,193 @@
+"""
+Compiled term stores for fast look up tables.
+
+A store is compiled once from a term CSV or ZIP and holds a look up table, pattern to
+value, for every field in the source. The keys are sorted and kept with the values in
+NUL-separated blobs along with arrays of offsets into the blobs. The file is memory
+mapped so opening it parses nothing.
+
+Small tables are turned into dicts by splitting the blobs, which is still much faster
+than parsing the CSV. Big tables, like taxon lists, are searched in the memory map so
+they never need to be loaded.
+
+Stores remember a hash of their source and are recompiled when it changes.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"TRTERMS1"
+HEADER_LEN = struct.Struct("<I")
+
+SMALL_TABLE = 50_000  # Tables with fewer entries are loaded into dicts
+
+STORES: dict[Path, "TermStore"] = {}  # Source path -> open store
+
+
+class TermStore:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.mm[: len(MAGIC)] != MAGIC:
+            msg = f"{path} is not a term store"
+            raise ValueError(msg)
+
+        start = len(MAGIC) + HEADER_LEN.size
+        (header_len,) = HEADER_LEN.unpack_from(self.mm, len(MAGIC))
+        self.header = json.loads(self.mm[start : start + header_len])
+        self.base = start + header_len
+
+    @property
+    def source_hash(self) -> str:
+        return self.header["source_hash"]
+
+    def table(
+        self,
+        field: str,
+        type_: type | None = None,
+        small_table: int = SMALL_TABLE,
+    ) -> Mapping[str, Any]:
+        type_ = type_ or str
+        info = self.header["tables"].get(field)
+        if not info or not info["count"]:
+            return {}
+
+        if info["count"] >= small_table:
+            return TermTable(self, info, type_)
+
+        # Drop the last separator before splitting
+        keys = self.blob(info["keys"])[:-1].decode("utf8").split("\0")
+        values = self.blob(info["values"])[:-1].decode("utf8").split("\0")
+        return {k: type_(v) for k, v in zip(keys, values, strict=True)}
+
+    def blob(self, span: list[int]) -> bytes:
+        return self.mm[self.base + span[0] : self.base + span[1]]
+
+    def offsets(self, span: list[int]) -> memoryview:
+        return memoryview(self.mm)[self.base + span[0] : self.base + span[1]].cast("I")
+
+
+class TermTable(Mapping):
+    """A look up table that is searched in a store's memory map."""
+
+    def __init__(self, store: TermStore, info: dict[str, Any], type_: type) -> None:
+        self.mm = store.mm
+        self.type_ = type_
+        self.count = info["count"]
+        self.keys_at = store.base + info["keys"][0]
+        self.values_at = store.base + info["values"][0]
+        self.key_offsets = store.offsets(info["key_offsets"])
+        self.value_offsets = store.offsets(info["value_offsets"])
+
+    def key(self, i: int) -> bytes:
+        start = self.keys_at + self.key_offsets[i]
+        end = self.keys_at + self.key_offsets[i + 1] - 1  # Skip the separator
+        return self.mm[start:end]
+
+    def __getitem__(self, key: str) -> Any:
+        encoded = key.encode("utf8")
+        i = bisect_left(range(self.count), encoded, key=self.key)
+        if i == self.count or self.key(i) != encoded:
+            raise KeyError(key)
+
+        start = self.values_at + self.value_offsets[i]
+        end = self.values_at + self.value_offsets[i + 1] - 1
+        return self.type_(self.mm[start:end].decode("utf8"))
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.count):
+            yield self.key(i).decode("utf8")
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def store_path(source: Path, store_dir: str | Path) -> Path:
+    """Name the store after the source's full path so same-named files don't clash."""
+    digest = hashlib.sha256(str(source.resolve()).encode()).hexdigest()[:12]
+    return Path(store_dir) / f"{source.stem}-{digest}.terms"
+
+
+def source_hash(source: Path) -> str:
+    return hashlib.sha256(source.read_bytes()).hexdigest()
+
+
+def open_store(source: Path, store_dir: str | Path) -> TermStore | None:
+    """Open the store for a term file, or None if it is missing or out of date."""
+    if store := STORES.get(source):
+        return store
+
+    path = store_path(source, store_dir)
+    if not path.exists():
+        return None
+
+    store = TermStore(path)
+    if store.source_hash != source_hash(source):
+        return None
+
+    STORES[source] = store
+    return store
+
+
+def compile_store(
+    source: Path,
+    store_dir: str | Path,
+    tables: dict[str, dict[str, str]],  # Field -> pattern -> value
+) -> TermStore:
+    """Write the look up tables for a term file to its store and open it."""
+    header = {"source_hash": source_hash(source), "tables": {}}
+    blobs = bytearray()
+
+    def add_blob(data: bytes) -> list[int]:
+        blobs.extend(data)
+        return [len(blobs) - len(data), len(blobs)]
+
+    for field, table in sorted(tables.items()):
+        entries = sorted((k.encode("utf8"), v.encode("utf8")) for k, v in table.items())
+        info = {"count": len(entries)}
+
+        for name, column in (("key", 0), ("value", 1)):
+            blob, offsets = bytearray(), array("I")
+            for entry in entries:
+                offsets.append(len(blob))
+                blob += entry[column] + b"\0"
+            offsets.append(len(blob))
+
+            info[f"{name}s"] = add_blob(blob)
+            info[f"{name}_offsets"] = add_blob(offsets.tobytes())
+
+        header["tables"][field] = info
+
+    header = json.dumps(header).encode()
+
+    path = store_path(source, store_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp = tempfile.mkstemp(prefix=f"{path.name}.", dir=path.parent)
+    temp = Path(temp)
+    try:
+        with os.fdopen(handle, "wb") as f:
+            f.write(MAGIC)
+            f.write(HEADER_LEN.pack(len(header)))
+            f.write(header)
+            f.write(blobs)
+        temp.replace(path)
+    except OSError:
+        # Another process compiled the same store first
+        if not path.exists():
+            raise
+    finally:
+        temp.unlink(missing_ok=True)
+
+    STORES[source] = TermStore(path)
+    return STORES[source]
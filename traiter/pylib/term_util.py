@@ -1,26 +1,83 @@
 import csv
-from collections.abc import Iterable
+import os
+from collections import ChainMap
+from collections.abc import Iterable, Mapping
 from io import TextIOWrapper
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from zipfile import ZipFile
 
+from traiter.pylib import term_store
+
+# Set this to a directory to use compiled term stores for the look up tables
+TERM_STORE_DIR = os.environ.get("TRAITER_TERM_STORE")
+
+# Term files are parsed once per process and the results are shared by every rule
+TERMS: dict[Path, tuple[Mapping[str, str], ...]] = {}  # Term file -> parsed terms
+TABLES: dict[tuple, Mapping[str, Any]] = {}  # (Term files, field, type) -> table
+
 
 def look_up_table(
     csv_path: Path | Iterable[Path],
     field: str,
     type_: type | None = None,
-) -> dict[str, Any]:
-    paths = csv_path if isinstance(csv_path, Iterable) else [csv_path]
-    data = {}
-    for path in paths:
-        terms = read_terms(path)
-        data |= term_patterns(terms, field, type_)
-    return data
+) -> Mapping[str, Any]:
+    """
+    Get a pattern to value table.
+
+    The table is shared by every rule, so it is returned as a read only
+    MappingProxyType. Use dict(table) to get a copy that can be changed.
+    """
+    paths = list(csv_path) if isinstance(csv_path, Iterable) else [csv_path]
+    key = (tuple(Path(p).resolve() for p in paths), field, type_)
+
+    if (table := TABLES.get(key)) is not None:
+        return table
+
+    if TERM_STORE_DIR:
+        table = stored_look_up_table(paths, field, type_)
+    elif len(paths) == 1:
+        table = term_patterns(term_file(paths[0]), field, type_)
+    else:
+        table = {}
+        for path in paths:
+            table |= look_up_table(path, field, type_)
+
+    TABLES[key] = MappingProxyType(table)
+    return TABLES[key]
+
+
+def stored_look_up_table(
+    paths: Iterable[Path],
+    field: str,
+    type_: type | None = None,
+) -> Mapping[str, Any]:
+    """Get a look up table from the compiled term stores, compiling them if needed."""
+    tables = [compiled_store(p).table(field, type_) for p in paths]
+
+    if all(isinstance(t, dict) for t in tables):
+        data = {}
+        for table in tables:
+            data |= table
+        return data
+
+    # Later files take precedence, just like above
+    return ChainMap(*reversed(tables))
+
+
+def compiled_store(path: Path) -> term_store.TermStore:
+    if store := term_store.open_store(path, TERM_STORE_DIR):
+        return store
+
+    terms = term_file(path)
+    fields = {k for t in terms for k in t if k != "pattern"}
+    tables = {f: term_patterns(terms, f) for f in fields}
+    return term_store.compile_store(path, TERM_STORE_DIR, tables)
 
 
 def term_patterns(
-    terms: list[dict[str, Any]],
+    terms: Iterable[Mapping[str, Any]],
     field: str,
     type_: type | None = None,
 ) -> dict[str, Any]:
@@ -34,15 +91,34 @@ def term_patterns(
 
 
 def read_terms(csv_path: Path | Iterable[Path]) -> list[dict]:
+    """Get copies of the terms that the caller is free to change."""
     paths = csv_path if isinstance(csv_path, Iterable) else [csv_path]
     terms = []
     for path in paths:
-        if path.suffix == ".zip":
-            with ZipFile(path) as zippy, zippy.open(f"{path.stem}.csv") as in_csv:
-                reader = csv.DictReader(TextIOWrapper(in_csv, "utf-8"))
-                terms += list(reader)
-        else:
-            with path.open(encoding="utf8") as term_file:
-                reader = csv.DictReader(term_file)
-                terms += list(reader)
+        terms += [dict(t) for t in term_file(path)]
+    return terms
+
+
+def term_file(path: Path) -> tuple[Mapping[str, str], ...]:
+    """Parse a term file the first time it is used. The terms are shared, read only."""
+    key = Path(path).resolve()
+
+    if (terms := TERMS.get(key)) is not None:
+        return terms
+
+    if path.suffix == ".zip":
+        with ZipFile(path) as zippy, zippy.open(f"{path.stem}.csv") as in_csv:
+            rows = list(csv.DictReader(TextIOWrapper(in_csv, "utf-8")))
+    else:
+        with path.open(encoding="utf8") as in_csv:
+            rows = list(csv.DictReader(in_csv))
+
+    terms = tuple(MappingProxyType(r) for r in rows)
+    TERMS[key] = terms
     return terms
+
+
+def clear_terms() -> None:
+    """Forget the parsed term files, for when they change while running."""
+    TERMS.clear()
+    TABLES.clear()
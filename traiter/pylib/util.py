@@ -1,5 +1,38 @@
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+
 import ftfy
 import regex as re
+from ftfy import chardata
+from ftfy.badness import is_bad
+
+from traiter.pylib import replacer
+
+# Join hyphenated words when they are at the end of a line
+HYPHEN_JOIN = re.compile(r"([a-z])-\s+([a-z])", flags=re.IGNORECASE)
+
+CONTROL_CHARS = re.compile(r"\p{Cc}+")
+
+MAX_CLEANERS = 32  # Cached cleaners for clean_text()
+
+# (Trans id, replace id) -> (trans, replace, their sizes, cleaner). The dicts are kept
+# so their ids are not reused by other dicts while they are cached.
+CLEANERS: OrderedDict[tuple[int, int], tuple] = OrderedDict()
+
+# Characters that ftfy fixes even when there is no mojibake: HTML entities, terminal
+# escapes, curly quotes, line breaks, ligatures, wide characters, control characters,
+# and surrogates
+FTFY_CHARS = re.compile(
+    "[&\x1b\r\u2028\u2029\u02bc\u2018-\u201f\x80-\x9f\ud800-\udfff"
+    + "".join(
+        re.escape(chr(c))
+        for c in sorted(
+            {*chardata.LIGATURES, *chardata.WIDTH_MAP, *chardata.CONTROL_CHARS}
+        )
+    )
+    + "]"
+)
 
 
 def shorten(text: str) -> str:
@@ -32,27 +65,127 @@ def to_positive_int(value: str | float) -> int | None:
         return None
 
 
+class TextCleaner:
+    """
+    Clean texts before trait extraction.
+
+    Build one cleaner and use it for many texts. The replacements are all done in one
+    pass where the longest match wins, and replaced text is not replaced again. When
+    they are all single characters they are combined with the translations into one
+    translation table. Running ftfy is most of the cost of cleaning, so it is skipped
+    when there is nothing in the text for it to fix, which is true for most labels.
+    """
+
+    def __init__(
+        self,
+        trans: dict[int, str] | None = None,
+        replace: dict[str, str] | None = None,
+    ) -> None:
+        trans, replace = trans or {}, replace or {}
+        self.replace = None
+
+        if all(len(k) == 1 for k in replace):
+            self.table = translation_table(trans, replace)
+        else:
+            self.table = translation_table(trans, {})
+            self.replace = replacer.compile_replacements(replace)
+
+    def __call__(self, text: str) -> str:
+        text = text or ""
+
+        # Handle uncommon mojibake
+        if self.table:
+            text = text.translate(self.table)
+
+        if self.replace:
+            text = self.replace(text)
+
+        text = shorten(text)  # Space normalize
+
+        if "-" in text:
+            text = HYPHEN_JOIN.sub(r"\1\2", text)
+
+        if needs_ftfy(text):
+            text = ftfy.fix_text(text)  # Handle common mojibake
+            text = CONTROL_CHARS.sub(" ", text)  # Remove control characters
+
+        return text
+
+    def pipe(self, texts: Iterable[str]) -> Iterator[str]:
+        for text in texts:
+            yield self(text)
+
+
 def clean_text(
     text: str,
     trans: dict[int, str] | None = None,
     replace: dict[str, str] | None = None,
 ) -> str:
-    """Clean text before trait extraction."""
-    text = text or ""
+    """
+    Clean text before trait extraction.
+
+    A cleaner is built for each trans and replace pair and reused while the same
+    dicts are passed in. Adding or removing entries builds a new cleaner, but changing
+    a value in place does not, so pass new dicts or build a new TextCleaner after
+    changing one. Use a TextCleaner when cleaning many texts, it saves looking the
+    cleaner up every time.
+    """
+    if not trans and not replace:
+        return CLEANER(text)
+
+    return cached_cleaner(trans, replace)(text)
+
+
+def cached_cleaner(
+    trans: dict[int, str] | None,
+    replace: dict[str, str] | None,
+) -> TextCleaner:
+    key = (id(trans), id(replace))
+    sizes = (len(trans or {}), len(replace or {}))
+
+    entry = CLEANERS.get(key)
+    if entry and entry[2] == sizes:
+        CLEANERS.move_to_end(key)
+        return entry[3]
+
+    cleaner = TextCleaner(trans, replace)
+    CLEANERS[key] = (trans, replace, sizes, cleaner)
+    CLEANERS.move_to_end(key)
+    if len(CLEANERS) > MAX_CLEANERS:
+        CLEANERS.popitem(last=False)
+    return cleaner
+
+
+def clean_texts(
+    texts: Iterable[str],
+    trans: dict[int, str] | None = None,
+    replace: dict[str, str] | None = None,
+) -> Iterator[str]:
+    """Clean a stream of texts, like the ones going into nlp.pipe()."""
+    return TextCleaner(trans, replace).pipe(texts)
+
 
-    # Handle uncommon mojibake
-    if trans:
-        text = text.translate(trans)
+def translation_table(trans: dict[int, str], replace: dict[str, str]) -> dict[int, str]:
+    """Fold single character replacements into a translation table."""
+    chars = {k for k in trans if isinstance(k, int)}
+    chars |= {ord(k) for k in replace}
 
-    if replace:
-        for old, new in replace.items():
-            text = text.replace(old, new)
+    table = {}
+    for char in chars:
+        text = chr(char).translate(trans)
+        table[char] = "".join(replace.get(c, c) for c in text)
+    return table
 
-    text = shorten(text)  # Space normalize
 
-    # Join hyphenated words when they are at the end of a line
-    text = re.sub(r"([a-z])-\s+([a-z])", r"\1\2", text, flags=re.IGNORECASE)
+def needs_ftfy(text: str) -> bool:
+    """Look for anything that ftfy would change in the text."""
+    if text.isascii():
+        return "&" in text or not text.isprintable()
+    return bool(
+        FTFY_CHARS.search(text)
+        or is_bad(text)
+        or not unicodedata.is_normalized("NFC", text)
+    )
 
-    text = ftfy.fix_text(text)  # Handle common mojibake
 
-    return re.sub(r"\p{Cc}+", " ", text)  # Remove control characters
+CLEANER = TextCleaner()  # The default cleaner
@@ -1,20 +1,41 @@
+import copy
 import sys
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from typing import Any
 
 from spacy.language import Language
 from spacy.tokens import Span
 
+# The fields that are output for each trait class
+PUBLIC_FIELDS: dict[type, tuple[str, ...]] = {}
 
-@dataclass(eq=False)
+# Field values of these types are output as is, anything else is converted like
+# dataclasses.asdict() does
+ATOMIC = (str, int, float)
+
+
+@dataclass(eq=False, slots=True)
 class BaseRule:
     _trait: str = ""
     _text: str = ""
     start: int = sys.maxsize
     end: int = -1
 
-    def __eq__(self, other: "BaseRule") -> bool:
-        return self.to_dict() == other.to_dict()
+    def __eq__(self, other: object) -> bool:
+        if type(self) is type(other):
+            return all(
+                getattr(self, f) == getattr(other, f) for f in self.public_fields()
+            )
+        if isinstance(other, BaseRule):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    @classmethod
+    def public_fields(cls) -> tuple[str, ...]:
+        if (names := PUBLIC_FIELDS.get(cls)) is None:
+            names = tuple(f.name for f in fields(cls) if f.name[0] != "_")
+            PUBLIC_FIELDS[cls] = names
+        return names
 
     @classmethod
     def from_ent(cls, ent: Span, **kwargs: Any) -> Any:
@@ -25,8 +46,24 @@ class BaseRule:
         return cls(**kwargs)
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in asdict(self).items() if v is not None and k[0] != "_"}
+        """Get the public fields that have a value, like dataclasses.asdict()."""
+        return {
+            k: v if isinstance(v, ATOMIC) else to_plain(v)
+            for k in self.public_fields()
+            if (v := getattr(self, k)) is not None
+        }
 
     @classmethod
     def pipe(cls, nlp: Language) -> None:
         raise NotImplementedError
+
+
+def to_plain(value: Any) -> Any:
+    """Convert dataclasses to dicts and copy everything else, as asdict() would."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(to_plain(v) for v in value)
+    if isinstance(value, dict):
+        return type(value)((to_plain(k), to_plain(v)) for k, v in value.items())
+    return copy.deepcopy(value)
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar
@@ -12,12 +13,14 @@ from traiter.pylib.pattern_compiler import Compiler
 from traiter.rules.base_rule import BaseRule
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Color(BaseRule):
     # Class vars ----------
     color_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "color_terms.csv"
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(color_csv, "replace")
-    remove: ClassVar[dict[str, int]] = term_util.look_up_table(color_csv, "remove", int)
+    replace: ClassVar[Mapping[str, str]] = term_util.look_up_table(color_csv, "replace")
+    remove: ClassVar[Mapping[str, int]] = term_util.look_up_table(
+        color_csv, "remove", int
+    )
     # ---------------------
 
     color: str | None = None
@@ -1,7 +1,10 @@
 import re
-from calendar import IllegalMonthError
+from calendar import IllegalMonthError, month_name, monthrange
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date as dt
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar
 
@@ -16,15 +19,25 @@ from traiter.pylib import term_util
 from traiter.pylib.pattern_compiler import Compiler
 from traiter.rules.base_rule import BaseRule
 
+MONTHS = {m.lower(): i for i, m in enumerate(month_name) if m}
+MONTHS_PER_YEAR = 12
+DAYS = 31  # Most days in a month
+CENTURY = 100
+YEAR_LEN = 4
 
-@dataclass(eq=False)
+SEP = "(.,/_'-"
+NUMERIC = re.compile(rf"^[\d{SEP}]+$")
+SEPARATORS = re.compile(rf"[{SEP}]+")
+
+
+@dataclass(eq=False, slots=True)
 class Date(BaseRule):
     # Class vars ----------
     date_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "date_terms.csv"
     month_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "month_terms.csv"
     all_csvs: ClassVar[list[Path]] = [date_csv, month_csv]
-    sep: ClassVar[str] = "(.,/_'-"
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(all_csvs, "replace")
+    sep: ClassVar[str] = SEP
+    replace: ClassVar[Mapping[str, str]] = term_util.look_up_table(all_csvs, "replace")
     # ---------------------
 
     date: str | None = None
@@ -87,13 +100,24 @@ class Date(BaseRule):
 
     @classmethod
     def date_match(cls, ent: Span) -> "Date":
+        date_ = cls.from_frags(ent, dt.today())
+        if not date_:
+            raise reject_match.SkipTraitCreation
+        return date_
+
+    @classmethod
+    def date_matches(cls, ents: list[Span]) -> list["Date | None"]:
+        today = dt.today()
+        return [cls.from_frags(ent, today) for ent in ents]
+
+    @classmethod
+    def from_frags(cls, ent: Span, today: dt) -> "Date | None":
         frags = []
-        century_adjust = None
 
         for token in ent:
             # Get numeric parts, they're sometimes smashed together into 1 token
-            if re.match(rf"^[\d{cls.sep}]+$", token.text):
-                parts = [p for p in re.split(rf"[{cls.sep}]+", token.text) if p]
+            if NUMERIC.match(token.text):
+                parts = [p for p in SEPARATORS.split(token.text) if p]
                 if parts:
                     frags += parts
 
@@ -105,22 +129,11 @@ class Date(BaseRule):
                 )
                 frags.append(month)
 
-        # Try to parse the date
-        text = " ".join(frags)
-        try:
-            date_ = parser.parse(text).date()
-        except (parser.ParserError, IllegalMonthError):
-            raise reject_match.SkipTraitCreation from None
+        parsed = to_date(tuple(frags), today)
+        if not parsed:
+            return None
 
-        # Handle missing centuries like: May 22, 08
-        if date_ > dt.today():
-            date_ -= relativedelta(years=100)
-            century_adjust = True
-
-        if date_ > dt.today():
-            raise reject_match.SkipTraitCreation
-
-        date_ = date_.isoformat()[:10]
+        date_, century_adjust = parsed
 
         return cls.from_ent(
             ent,
@@ -131,13 +144,159 @@ class Date(BaseRule):
 
     @classmethod
     def short_date(cls, ent: Span) -> "Date":
-        date_ = cls.date_match(ent)
+        return cls.to_short(cls.date_match(ent))
+
+    @classmethod
+    def short_dates(cls, ents: list[Span]) -> list["Date | None"]:
+        return [cls.to_short(d) if d else None for d in cls.date_matches(ents)]
+
+    @staticmethod
+    def to_short(date_: "Date") -> "Date":
         date_._trait = "date"
         date_.missing_day = True
         date_.date = date_.date[:7] if date_.date else None
         return date_
 
 
+@lru_cache(maxsize=4096)
+def to_date(frags: tuple[str, ...], today: dt) -> tuple[str, bool | None] | None:
+    """
+    Convert date fragments into an ISO date and a century adjustment flag.
+
+    Most dates are assembled directly from their fragments and dateutil is only used
+    for the odd ones. Returns None if the fragments are not a valid past date.
+    """
+    date_ = assemble(frags, today)
+
+    if not date_:
+        default = datetime(today.year, today.month, today.day)  # noqa: DTZ001
+        try:
+            date_ = parser.parse(" ".join(frags), default=default).date()
+        except (parser.ParserError, IllegalMonthError):
+            return None
+
+    # Handle missing centuries like: May 22, 08
+    century_adjust = None
+    if date_ > today:
+        date_ -= relativedelta(years=100)
+        century_adjust = True
+
+    if date_ > today:
+        return None
+
+    return date_.isoformat()[:10], century_adjust
+
+
+def assemble(frags: tuple[str, ...], today: dt) -> dt | None:
+    """
+    Build a date from day, month, and year fragments the same way dateutil would.
+
+    This follows dateutil's defaults, like month before day, for the fragments our
+    patterns produce. It returns None for anything else, or for an invalid date, and
+    dateutil gets to have a go at it.
+    """
+    found = label_frags(frags)
+    if not found:
+        return None
+
+    values, month_at, year_at = found
+    year, month, day = resolve_ymd(values, month_at, year_at)
+
+    if year is None:
+        year = today.year
+    elif year_at is None and year < CENTURY:
+        year = two_digit_year(year, today)
+
+    month = today.month if month is None else month
+
+    try:
+        if day is None:
+            day = min(today.day, monthrange(year, month)[1])
+        return dt(year, month, day)
+    except (ValueError, IllegalMonthError):
+        return None
+
+
+def label_frags(
+    frags: tuple[str, ...],
+) -> tuple[list[int], int | None, int | None] | None:
+    """Get the fragment values and where the month name and 4-digit year are."""
+    if len(frags) not in (2, 3):
+        return None
+
+    values, month_at, year_at = [], None, None
+
+    for i, frag in enumerate(frags):
+        if frag.isascii() and frag.isdigit() and len(frag) in (1, 2, YEAR_LEN):
+            if len(frag) == YEAR_LEN:
+                if year_at is not None:
+                    return None
+                year_at = i
+            values.append(int(frag))
+
+        elif (month := MONTHS.get(frag.lower())) and month_at is None:
+            month_at = i
+            values.append(month)
+
+        else:
+            return None
+
+    return values, month_at, year_at
+
+
+def resolve_ymd(  # noqa: C901, PLR0911
+    values: list[int], month_at: int | None, year_at: int | None
+) -> tuple[int | None, int | None, int | None]:
+    """Decide which value is the year, month, and day. Mirrors dateutil's _ymd."""
+    if month_at is not None and year_at is not None:
+        others = [v for i, v in enumerate(values) if i not in (month_at, year_at)]
+        return values[year_at], values[month_at], others[0] if others else None
+
+    if month_at is not None and len(values) == 2:  # noqa: PLR2004
+        other = values[1 - month_at]
+        return (
+            (other, values[month_at], None)
+            if other > DAYS
+            else (None, values[month_at], other)
+        )
+
+    if len(values) == 2:  # noqa: PLR2004
+        if values[0] > DAYS:
+            return values[0], values[1], None
+        if values[1] > DAYS:
+            return values[1], values[0], None
+        return None, values[0], values[1]
+
+    first, second, third = values
+
+    if month_at == 0:
+        return (second, first, third) if second > DAYS else (third, first, second)
+
+    if month_at == 1:
+        return (first, second, third) if first > DAYS else (third, second, first)
+
+    if month_at == 2:  # noqa: PLR2004
+        return (second, third, first) if second > DAYS else (first, third, second)
+
+    if first > DAYS or year_at == 0:
+        return first, second, third
+
+    if first > MONTHS_PER_YEAR:
+        return third, second, first
+
+    return third, first, second
+
+
+def two_digit_year(year: int, today: dt) -> int:
+    """Put a 2-digit year within 50 years of today, like dateutil does."""
+    year += today.year // CENTURY * CENTURY
+    if year >= today.year + CENTURY // 2:
+        year -= CENTURY
+    elif year < today.year - CENTURY // 2:
+        year += CENTURY
+    return year
+
+
 @registry.misc("date_match")
 def date_match(ent: Span) -> Date:
     return Date.date_match(ent)
@@ -146,3 +305,13 @@ def date_match(ent: Span) -> Date:
 @registry.misc("short_date_match")
 def short_date_match(ent: Span) -> Date:
     return Date.short_date(ent)
+
+
+@registry.misc("date_match_batch")
+def date_match_batch(ents: list[Span]) -> list[Date | None]:
+    return Date.date_matches(ents)
+
+
+@registry.misc("short_date_match_batch")
+def short_date_match_batch(ents: list[Span]) -> list[Date | None]:
+    return Date.short_dates(ents)
@@ -1,4 +1,5 @@
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar
@@ -13,7 +14,7 @@ from traiter.pylib.pattern_compiler import Compiler
 from traiter.rules.base_rule import BaseRule
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Elevation(BaseRule):
     # Class vars ----------
     float_re: ClassVar[str] = r"^(\d[\d,.]*)$"
@@ -26,8 +27,8 @@ class Elevation(BaseRule):
     tic_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "unit_tic_terms.csv"
     all_csvs: ClassVar[list[Path]] = [elevation_csv, unit_csv, about_csv, tic_csv]
 
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(all_csvs, "replace")
-    factors_cm: ClassVar[dict[str, float]] = term_util.look_up_table(
+    replace: ClassVar[Mapping[str, str]] = term_util.look_up_table(all_csvs, "replace")
+    factors_cm: ClassVar[Mapping[str, float]] = term_util.look_up_table(
         (unit_csv, tic_csv),
         "factor_cm",
         float,
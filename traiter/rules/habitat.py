@@ -1,4 +1,5 @@
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar
@@ -14,11 +15,13 @@ from traiter.pylib.pattern_compiler import Compiler
 from traiter.rules.base_rule import BaseRule
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Habitat(BaseRule):
     # Class vars ----------
     habitat_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "habitat_terms.csv"
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(habitat_csv, "replace")
+    replace: ClassVar[Mapping[str, str]] = term_util.look_up_table(
+        habitat_csv, "replace"
+    )
     sep: ClassVar[str] = "/,-"
     # ---------------------
 
@@ -1,4 +1,5 @@
 import re
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import ClassVar
@@ -13,7 +14,7 @@ from traiter.pylib.pattern_compiler import Compiler
 from traiter.rules.base_rule import BaseRule
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class LatLong(BaseRule):
     # Class vars ----------
     sym: ClassVar[str] = r"""°"”“'`‘´’"""
@@ -28,8 +29,8 @@ class LatLong(BaseRule):
     )
     unit_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "unit_length_terms.csv"
     all_csvs: ClassVar[list[Path]] = [lat_long_csv, unit_csv, datum_csv]
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(all_csvs, "replace")
-    factors_cm: ClassVar[dict[str, float]] = term_util.look_up_table(
+    replace: ClassVar[Mapping[str, str]] = term_util.look_up_table(all_csvs, "replace")
+    factors_cm: ClassVar[Mapping[str, float]] = term_util.look_up_table(
         unit_csv,
         "factor_cm",
         float,
@@ -1,4 +1,5 @@
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar
@@ -25,11 +26,11 @@ UNIQUE = 0  # A tiebreaker used to rename the Number pipe
 HAS_WHOLE = 3
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Number(BaseRule):
     # Class vars ----------
     csv: ClassVar[Path] = Path(__file__).parent / "terms" / "number_word_terms.csv"
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(csv, "replace", int)
+    replace: ClassVar[Mapping[str, int]] = term_util.look_up_table(csv, "replace", int)
     # ---------------------
 
     number: float | None = None
@@ -1,4 +1,5 @@
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar
@@ -13,11 +14,11 @@ from traiter.pylib.pattern_compiler import Compiler
 from traiter.rules.base_rule import BaseRule
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class TRS(BaseRule):
     # Class vars ----------
     trs_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "trs_terms.csv"
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table([trs_csv], "replace")
+    replace: ClassVar[Mapping[str, str]] = term_util.look_up_table([trs_csv], "replace")
     dir_: ClassVar[str] = """((north|east|south|west)(ing)?|[nesw])"""
     min_len: ClassVar[int] = 2
     # ---------------------
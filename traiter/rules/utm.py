@@ -1,4 +1,5 @@
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar
@@ -13,7 +14,7 @@ from traiter.pylib.pattern_compiler import Compiler
 from traiter.rules.base_rule import BaseRule
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class UTM(BaseRule):
     # Class vars ----------
     sym: ClassVar[str] = r"""°"”“'`‘´’"""
@@ -22,7 +23,7 @@ class UTM(BaseRule):
     utm_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "utm_terms.csv"
     unit_csv: ClassVar[Path] = Path(__file__).parent / "terms" / "unit_length_terms.csv"
     all_csvs: ClassVar[list[Path]] = [utm_csv, datum_csv, unit_csv]
-    replace: ClassVar[dict[str, str]] = term_util.look_up_table(all_csvs, "replace")
+    replace: ClassVar[Mapping[str, str]] = term_util.look_up_table(all_csvs, "replace")
     dir_: ClassVar[str] = """((north|east|south|west)(ing)?|[nesw])"""
     # ---------------------
 
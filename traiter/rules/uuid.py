@@ -12,7 +12,7 @@ from traiter.pylib.pattern_compiler import Compiler
 from traiter.rules.base_rule import BaseRule
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Uuid(BaseRule):
     # Class vars ----------
     hx: ClassVar[str] = "[0-9A-Fa-f]"